@@ -13,6 +13,7 @@ import logging
 import requests
 import urllib3
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple, Union
 
@@ -426,11 +427,18 @@ class ISCSIComponent(BaseComponent):
             return
             
         try:
+            # The listings are independent, so fetch them concurrently on the shared session
+            endpoints = ['pool', 'pool/dataset?type=VOLUME', 'iscsi/target', 'iscsi/extent', 'iscsi/targetextent']
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+                futures = [executor.submit(self.session.get, f"{self.api_url}/{endpoint}") for endpoint in endpoints]
+            pools_response, zvols_response, targets_response, extents_response, targetextents_response = (
+                future.result() for future in futures
+            )
+            
             # Discover storage pools
             self.logger.info("Discovering storage pools...")
-            response = self.session.get(f"{self.api_url}/pool")
-            if response.status_code == 200:
-                pools = response.json()
+            if pools_response.status_code == 200:
+                pools = pools_response.json()
                 self.discovery_results["pools"] = pools
                 
                 for pool in pools:
@@ -441,9 +449,8 @@ class ISCSIComponent(BaseComponent):
             
             # Discover existing zvols (volumes)
             self.logger.info("Discovering existing zvols...")
-            response = self.session.get(f"{self.api_url}/pool/dataset?type=VOLUME")
-            if response.status_code == 200:
-                zvols = response.json()
+            if zvols_response.status_code == 200:
+                zvols = zvols_response.json()
                 self.discovery_results["zvols"] = zvols
                 
                 if zvols:
@@ -457,9 +464,8 @@ class ISCSIComponent(BaseComponent):
             
             # Discover iSCSI targets
             self.logger.info("Discovering iSCSI targets...")
-            response = self.session.get(f"{self.api_url}/iscsi/target")
-            if response.status_code == 200:
-                targets = response.json()
+            if targets_response.status_code == 200:
+                targets = targets_response.json()
                 self.discovery_results["targets"] = targets
                 
                 if targets:
@@ -472,9 +478,8 @@ class ISCSIComponent(BaseComponent):
             
             # Discover iSCSI extents
             self.logger.info("Discovering iSCSI extents...")
-            response = self.session.get(f"{self.api_url}/iscsi/extent")
-            if response.status_code == 200:
-                extents = response.json()
+            if extents_response.status_code == 200:
+                extents = extents_response.json()
                 self.discovery_results["extents"] = extents
                 
                 if extents:
@@ -489,9 +494,8 @@ class ISCSIComponent(BaseComponent):
             
             # Discover target-extent associations
             self.logger.info("Discovering target-extent associations...")
-            response = self.session.get(f"{self.api_url}/iscsi/targetextent")
-            if response.status_code == 200:
-                targetextents = response.json()
+            if targetextents_response.status_code == 200:
+                targetextents = targetextents_response.json()
                 self.discovery_results["targetextents"] = targetextents
                 
                 if targetextents:
@@ -15,7 +15,10 @@ import logging
 import requests
 import urllib3
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import (
     Dict, Any, Optional, List, Tuple, Union, TypedDict, 
     Literal, Protocol, cast, NotRequired
@@ -28,6 +31,9 @@ from framework.base_component_py312 import BaseComponent, ComponentConfig
 # Disable SSL warnings for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Multiply by this instead of dividing by 1024**3 when converting bytes to GB
+_INV_GIB: float = 1.0 / (1024 ** 3)
+
 # TypedDict definitions for iSCSI component
 class ISCSIConfig(ComponentConfig, total=False):
     """TypedDict for iSCSI component configuration."""
@@ -448,6 +454,11 @@ class ISCSIComponent(BaseComponent):
             self.timestamps['housekeep_end'] = datetime.datetime.now().isoformat()
             
             raise
+        
+        finally:
+            # Housekeeping is the last phase, release pooled connections
+            if self.session is not None:
+                self.session.close()
     
     # Helper methods
     def _format_resource_names(self) -> None:
@@ -469,8 +480,15 @@ class ISCSIComponent(BaseComponent):
         """Set up API session with authentication"""
         self.logger.info("Setting up API session")
         
-        # Create requests session
-        self.session = requests.Session()
+        # Reuse the session across phases so the TCP/TLS connection stays warm
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            self.session.mount("https://", adapter)
         
         # Set up API URL
         truenas_ip = self.config.get('truenas_ip')
@@ -481,7 +499,10 @@ class ISCSIComponent(BaseComponent):
             self.logger.error("No API key provided for TrueNAS authentication")
             raise ValueError("TrueNAS API key is required")
             
-        self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
         
         # Disable SSL verification for self-signed certs
         self.session.verify = False
@@ -558,7 +579,7 @@ class ISCSIComponent(BaseComponent):
                     memory_total = memory_data[-1][2]
                     if memory_total > 0:
                         memory_percent = (memory_usage / memory_total) * 100
-                        self.logger.info(f"Memory Usage: {memory_percent:.1f}% ({memory_usage/(1024*1024*1024):.1f}GB / {memory_total/(1024*1024*1024):.1f}GB)")
+                        self.logger.info(f"Memory Usage: {memory_percent:.1f}% ({memory_usage * _INV_GIB:.1f}GB / {memory_total * _INV_GIB:.1f}GB)")
                         
                         # Update health info with Python 3.12 dict merge
                         health_info |= {
@@ -631,24 +652,30 @@ class ISCSIComponent(BaseComponent):
             return
             
         try:
+            # The listings are independent, so fetch them concurrently on the pooled session
+            endpoints = ['pool', 'pool/dataset?type=VOLUME', 'iscsi/target', 'iscsi/extent', 'iscsi/targetextent']
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+                futures = [executor.submit(self.session.get, f"{self.api_url}/{endpoint}") for endpoint in endpoints]
+            pools_response, zvols_response, targets_response, extents_response, targetextents_response = (
+                future.result() for future in futures
+            )
+            
             # Discover storage pools
             self.logger.info("Discovering storage pools...")
-            response = self.session.get(f"{self.api_url}/pool")
-            if response.status_code == 200:
-                pools = cast(List[StoragePool], response.json())
+            if pools_response.status_code == 200:
+                pools = cast(List[StoragePool], pools_response.json())
                 self.discovery_results["pools"] = pools
                 
                 for pool in pools:
                     pool_name = pool.get('name')
                     free_bytes = pool.get('free', 0)
-                    free_gb = free_bytes / (1024**3)
+                    free_gb = free_bytes * _INV_GIB
                     self.logger.info(f"Pool: {pool_name} ({free_gb:.1f} GB free)")
             
             # Discover existing zvols (volumes)
             self.logger.info("Discovering existing zvols...")
-            response = self.session.get(f"{self.api_url}/pool/dataset?type=VOLUME")
-            if response.status_code == 200:
-                zvols = cast(List[ZvolInfo], response.json())
+            if zvols_response.status_code == 200:
+                zvols = cast(List[ZvolInfo], zvols_response.json())
                 self.discovery_results["zvols"] = zvols
                 
                 if zvols:
@@ -656,16 +683,15 @@ class ISCSIComponent(BaseComponent):
                         zvol_name = zvol.get('name')
                         if volsize := zvol.get('volsize', {}):
                             zvol_size = volsize.get('parsed', 0)
-                            zvol_size_gb = zvol_size / (1024**3)
+                            zvol_size_gb = zvol_size * _INV_GIB
                             self.logger.info(f"Zvol: {zvol_name} ({zvol_size_gb:.1f} GB)")
                 else:
                     self.logger.info("No zvols found")
             
             # Discover iSCSI targets
             self.logger.info("Discovering iSCSI targets...")
-            response = self.session.get(f"{self.api_url}/iscsi/target")
-            if response.status_code == 200:
-                targets = cast(List[TargetInfo], response.json())
+            if targets_response.status_code == 200:
+                targets = cast(List[TargetInfo], targets_response.json())
                 self.discovery_results["targets"] = targets
                 
                 if targets:
@@ -678,9 +704,8 @@ class ISCSIComponent(BaseComponent):
             
             # Discover iSCSI extents
             self.logger.info("Discovering iSCSI extents...")
-            response = self.session.get(f"{self.api_url}/iscsi/extent")
-            if response.status_code == 200:
-                extents = cast(List[ExtentInfo], response.json())
+            if extents_response.status_code == 200:
+                extents = cast(List[ExtentInfo], extents_response.json())
                 self.discovery_results["extents"] = extents
                 
                 if extents:
@@ -695,9 +720,8 @@ class ISCSIComponent(BaseComponent):
             
             # Discover target-extent associations
             self.logger.info("Discovering target-extent associations...")
-            response = self.session.get(f"{self.api_url}/iscsi/targetextent")
-            if response.status_code == 200:
-                targetextents = cast(List[TargetExtentInfo], response.json())
+            if targetextents_response.status_code == 200:
+                targetextents = cast(List[TargetExtentInfo], targetextents_response.json())
                 self.discovery_results["targetextents"] = targetextents
                 
                 if targetextents:
@@ -732,8 +756,8 @@ class ISCSIComponent(BaseComponent):
             for pool in pools:
                 if pool.get('name') == pool_name:
                     free_bytes = pool.get('free', 0)
-                    free_gb = free_bytes / (1024**3)
-                    required_gb = required_bytes / (1024**3)
+                    free_gb = free_bytes * _INV_GIB
+                    required_gb = required_bytes * _INV_GIB
                     
                     self.logger.info(f"Pool: {pool_name}")
                     self.logger.info(f"Free space: {free_gb:.1f} GB")
@@ -708,11 +708,8 @@ class OpenShiftComponent(BaseComponent):
         iso_filename = os.path.basename(self.iso_path)
         
         # Calculate MD5 hash for integrity verification
-        md5_hash = hashlib.md5()
         with open(self.iso_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                md5_hash.update(chunk)
-        iso_hash = md5_hash.hexdigest()
+            iso_hash = hashlib.file_digest(f, 'md5').hexdigest()
         
         # Create metadata with Python 3.12 explicit type
         metadata: ISOMetadata = {
@@ -804,12 +801,9 @@ class OpenShiftComponent(BaseComponent):
             
         # Calculate MD5 hash for integrity verification
         try:
-            md5_hash = hashlib.md5()
             with open(self.iso_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5_hash.update(chunk)
+                iso_hash = hashlib.file_digest(f, 'md5').hexdigest()
             
-            iso_hash = md5_hash.hexdigest()
             self.logger.info(f"ISO MD5 hash: {iso_hash}")
             
             # Store hash in results
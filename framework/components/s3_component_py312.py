@@ -15,6 +15,7 @@ import logging
 import datetime
 import tempfile
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     Dict, List, Any, Optional, Union, Tuple, TypedDict, Literal,
@@ -65,6 +66,8 @@ class S3Config(ComponentConfig, total=False):
     create_metadata_index: bool
     cleanup_old_artifacts: bool
     max_artifact_age_days: int
+    multipart_chunksize: int
+    max_concurrency: int
 
 
 class BucketStatus(TypedDict):
@@ -165,7 +168,9 @@ class S3Component(BaseComponent):
             'isos/stable/'
         ],
         'create_buckets_if_missing': False,
-        'force_recreation': False
+        'force_recreation': False,
+        'multipart_chunksize': 64 * 1024 * 1024,  # 64 MiB parts
+        'max_concurrency': 10  # Parallel part uploads per file
     }
     
     def __init__(self, config: S3Config, logger: Optional[logging.Logger] = None) -> None:
@@ -193,6 +198,14 @@ class S3Component(BaseComponent):
         self.private_bucket: Optional[Bucket] = None
         self.public_bucket: Optional[Bucket] = None
         
+        # Files above boto3's multipart threshold are split into parts and sent
+        # concurrently; part size and concurrency come from DEFAULT_CONFIG
+        self.transfer_config = TransferConfig(
+            multipart_chunksize=self.config['multipart_chunksize'],
+            max_concurrency=self.config['max_concurrency'],
+            use_threads=True
+        )
+        
         # Initialize specific result types
         self.discovery_results: DiscoveryResults = {}
         self.processing_results: ProcessingResults = {}
@@ -354,9 +367,10 @@ class S3Component(BaseComponent):
         private_bucket_name = self.config.get('private_bucket')
         public_bucket_name = self.config.get('public_bucket')
         
-        # Check if buckets exist
+        # One list_buckets call answers every existence check; processing reuses
+        # the flags recorded here rather than issuing HEAD requests per bucket
         all_buckets = self.s3_client.list_buckets()
-        bucket_names = [b['Name'] for b in all_buckets.get('Buckets', [])]
+        bucket_names = {b['Name'] for b in all_buckets.get('Buckets', [])}
         
         # Check private bucket
         private_exists = private_bucket_name in bucket_names
@@ -482,21 +496,44 @@ class S3Component(BaseComponent):
             force_recreation = self.config.get('force_recreation', False)
             
             if create_buckets:
-                # Set up private bucket
-                self._setup_bucket(
-                    'private', 
-                    self.config.get('private_bucket', ''),
-                    self.config.get('folder_structure_private', []),
-                    force_recreation
-                )
+                # The private and public buckets are independent, so set them up
+                # concurrently. Each worker records its actions in its own list and
+                # only uses the thread-safe client; the actions are merged in a fixed
+                # order afterwards
+                bucket_actions: Dict[str, List[str]] = {'private': [], 'public': []}
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [
+                        executor.submit(
+                            self._setup_bucket,
+                            'private', 
+                            self.config.get('private_bucket', ''),
+                            self.config.get('folder_structure_private', []),
+                            force_recreation,
+                            bucket_actions['private']
+                        ),
+                        executor.submit(
+                            self._setup_bucket,
+                            'public', 
+                            self.config.get('public_bucket', ''),
+                            self.config.get('folder_structure_public', []),
+                            force_recreation,
+                            bucket_actions['public']
+                        )
+                    ]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    for actions in bucket_actions.values():
+                        self.processing_results['actions'].extend(actions)
                 
-                # Set up public bucket
-                self._setup_bucket(
-                    'public', 
-                    self.config.get('public_bucket', ''),
-                    self.config.get('folder_structure_public', []),
-                    force_recreation
-                )
+                # Update references to newly created buckets; boto3 resources are not
+                # thread-safe, so this happens here rather than in the workers
+                if self.s3_resource:
+                    if self.processing_results['buckets']['private']['created']:
+                        self.private_bucket = self.s3_resource.Bucket(self.config.get('private_bucket', ''))
+                    if self.processing_results['buckets']['public']['created']:
+                        self.public_bucket = self.s3_resource.Bucket(self.config.get('public_bucket', ''))
                 
                 # Set public bucket policy for anonymous access
                 if (self.discovery_results.get('buckets', {}).get('public', {}).get('exists', False) or 
@@ -527,7 +564,7 @@ class S3Component(BaseComponent):
             raise
     
     def _setup_bucket(self, bucket_type: Literal["private", "public"], bucket_name: str, 
-                     folder_structure: List[str], force: bool) -> None:
+                     folder_structure: List[str], force: bool, actions: List[str]) -> None:
         """
         Set up a bucket with the specified configuration.
         
@@ -536,6 +573,7 @@ class S3Component(BaseComponent):
             bucket_name: Name of the bucket
             folder_structure: List of folders to create
             force: Whether to force reconfiguration if the bucket exists
+            actions: List to record the actions taken for this bucket in
         """
         if not self.s3_client:
             self.logger.error("S3 client not initialized")
@@ -549,14 +587,7 @@ class S3Component(BaseComponent):
                 self.s3_client.create_bucket(Bucket=bucket_name)
                 self.logger.info(f"Created {bucket_type} bucket: {bucket_name}")
                 self.processing_results['buckets'][bucket_type]['created'] = True
-                self.processing_results['actions'].append(f'create_{bucket_type}_bucket')
-                
-                # Update reference
-                if self.s3_resource:
-                    if bucket_type == 'private':
-                        self.private_bucket = self.s3_resource.Bucket(bucket_name)
-                    else:
-                        self.public_bucket = self.s3_resource.Bucket(bucket_name)
+                actions.append(f'create_{bucket_type}_bucket')
                 
                 # Enable versioning for private bucket
                 if bucket_type == 'private':
@@ -565,7 +596,7 @@ class S3Component(BaseComponent):
                         VersioningConfiguration={'Status': 'Enabled'}
                     )
                     self.logger.info(f"Enabled versioning for {bucket_type} bucket")
-                    self.processing_results['actions'].append(f'enable_versioning_{bucket_type}')
+                    actions.append(f'enable_versioning_{bucket_type}')
                 
                 # Create folder structure
                 for folder in folder_structure:
@@ -584,7 +615,7 @@ class S3Component(BaseComponent):
                 
         elif force:
             self.logger.info(f"{bucket_type.capitalize()} bucket exists - reconfiguring due to force flag")
-            self.processing_results['actions'].append(f'reconfigure_{bucket_type}_bucket')
+            actions.append(f'reconfigure_{bucket_type}_bucket')
             
             # Enable versioning for private bucket if not already enabled
             if bucket_type == 'private' and not self.discovery_results.get('versioning', {}).get('private', False):
@@ -594,7 +625,7 @@ class S3Component(BaseComponent):
                         VersioningConfiguration={'Status': 'Enabled'}
                     )
                     self.logger.info(f"Enabled versioning for {bucket_type} bucket")
-                    self.processing_results['actions'].append(f'enable_versioning_{bucket_type}')
+                    actions.append(f'enable_versioning_{bucket_type}')
                 except Exception as e:
                     self.logger.error(f"Failed to enable versioning: {str(e)}")
             
@@ -616,7 +647,7 @@ class S3Component(BaseComponent):
             
         else:
             self.logger.info(f"{bucket_type.capitalize()} bucket exists - skipping creation")
-            self.processing_results['actions'].append(f'skip_{bucket_type}_bucket')
+            actions.append(f'skip_{bucket_type}_bucket')
     
     def _configure_public_bucket_policy(self) -> None:
         """
@@ -993,7 +1024,8 @@ class S3Component(BaseComponent):
                         Filename=content,
                         Bucket=private_bucket_name,
                         Key=s3_key,
-                        ExtraArgs={'Metadata': {k: str(v) for k, v in metadata.items()}}
+                        ExtraArgs={'Metadata': {k: str(v) for k, v in metadata.items()}},
+                        Config=self.transfer_config
                     )
                     self.logger.info(f"Uploaded file artifact {artifact_id} to {s3_key}")
                     
@@ -1091,7 +1123,8 @@ class S3Component(BaseComponent):
                 Filename=iso_path,
                 Bucket=self.config.get('private_bucket', ''),
                 Key=private_key,
-                ExtraArgs={'Metadata': metadata}
+                ExtraArgs={'Metadata': metadata},
+                Config=self.transfer_config
             )
             
             self.logger.info(f"Uploaded ISO to private bucket: {private_key}")
@@ -15,6 +15,7 @@ import logging
 import datetime
 import requests
 import tempfile
+from requests.adapters import HTTPAdapter
 from typing import (
     Dict, Any, Optional, List, Union, Tuple, TypedDict, 
     Literal, cast, Protocol, NotRequired
@@ -166,6 +167,12 @@ class VaultComponent(BaseComponent):
         self.headers: Dict[str, str] = {'X-Vault-Token': self.config.get('vault_token', '')}
         self.verify_ssl: bool = self.config.get('verify_ssl', True)
         
+        # All requests share one keep-alive session instead of reconnecting per call
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=16, pool_block=False)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Initialize connection state
         self.connected: bool = False
         self.client_token: Optional[str] = self.config.get('vault_token')
@@ -257,7 +264,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/sys/health",
                 headers=headers,
                 verify=self.verify_ssl
@@ -310,7 +317,7 @@ class VaultComponent(BaseComponent):
                 'secret_id': secret_id
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/v1/auth/approle/login",
                 json=data,
                 headers=headers,
@@ -351,7 +358,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/auth/token/lookup-self",
                 headers=headers,
                 verify=self.verify_ssl
@@ -388,7 +395,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/sys/mounts",
                 headers=headers,
                 verify=self.verify_ssl
@@ -450,7 +457,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/sys/auth",
                 headers=headers,
                 verify=self.verify_ssl
@@ -496,7 +503,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/{mount_point}/metadata",
                 headers=headers,
                 verify=self.verify_ssl
@@ -510,7 +517,7 @@ class VaultComponent(BaseComponent):
                 return
             
             # Try KV v1 direct access
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/{mount_point}",
                 headers=headers,
                 verify=self.verify_ssl
@@ -668,7 +675,7 @@ class VaultComponent(BaseComponent):
                 if vault_namespace := self.config.get('vault_namespace'):
                     headers['X-Vault-Namespace'] = vault_namespace
                     
-                response = requests.delete(
+                response = self.session.delete(
                     f"{self.base_url}/v1/{mount_point}/data/{secret_path}",
                     headers=headers,
                     verify=self.verify_ssl
@@ -754,7 +761,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v1/auth/token/lookup-self",
                 headers=headers,
                 verify=self.verify_ssl
@@ -793,7 +800,7 @@ class VaultComponent(BaseComponent):
             if vault_namespace := self.config.get('vault_namespace'):
                 headers['X-Vault-Namespace'] = vault_namespace
                 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/v1/auth/token/renew-self",
                 headers=headers,
                 verify=self.verify_ssl
@@ -852,14 +859,14 @@ class VaultComponent(BaseComponent):
                 
             # KV v2 API
             if self.kv_version == '2':
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/v1/{mount_point}/data/{full_path}",
                     headers=headers,
                     verify=self.verify_ssl
                 )
             # KV v1 API
             else:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/v1/{mount_point}/{full_path}",
                     headers=headers,
                     verify=self.verify_ssl
@@ -927,7 +934,7 @@ class VaultComponent(BaseComponent):
                 # Create payload with data wrapped in 'data' field
                 payload = {'data': data}
                 
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/v1/{mount_point}/data/{full_path}",
                     headers=headers,
                     json=payload,
@@ -935,7 +942,7 @@ class VaultComponent(BaseComponent):
                 )
             # KV v1 API
             else:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/v1/{mount_point}/{full_path}",
                     headers=headers,
                     json=data,
@@ -985,14 +992,14 @@ class VaultComponent(BaseComponent):
                 
             # KV v2 API
             if self.kv_version == '2':
-                response = requests.delete(
+                response = self.session.delete(
                     f"{self.base_url}/v1/{mount_point}/data/{full_path}",
                     headers=headers,
                     verify=self.verify_ssl
                 )
             # KV v1 API
             else:
-                response = requests.delete(
+                response = self.session.delete(
                     f"{self.base_url}/v1/{mount_point}/{full_path}",
                     headers=headers,
                     verify=self.verify_ssl
@@ -1047,7 +1054,7 @@ class VaultComponent(BaseComponent):
             # KV v2 API
             if self.kv_version == '2':
                 # For KV v2, list uses metadata endpoint
-                response = requests.request(
+                response = self.session.request(
                     "LIST",
                     f"{self.base_url}/v1/{mount_point}/metadata/{full_path}",
                     headers=headers,
@@ -1055,7 +1062,7 @@ class VaultComponent(BaseComponent):
                 )
             # KV v1 API
             else:
-                response = requests.request(
+                response = self.session.request(
                     "LIST",
                     f"{self.base_url}/v1/{mount_point}/{full_path}",
                     headers=headers,
@@ -6,8 +6,15 @@ This module demonstrates Python 3.12 type annotation features
 that can be used throughout the codebase.
 """
 
+import json
 from typing import TypedDict, Optional, Dict, List, Any, Callable, Generic, TypeVar
 
+# orjson is optional; it is considerably faster at indenting large result dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # TypeVar and Generic with simplified 3.12 syntax
 T = TypeVar('T')
@@ -90,6 +97,21 @@ def format_metadata(metadata: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Format component results as indented JSON.
+    
+    Args:
+        results: Results to format
+        
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(results, indent=2)
+
+
 # Performance-optimized function using comprehensions
 def filter_and_transform(items: List[Dict[str, Any]], 
                          filter_key: str,
@@ -29,7 +29,7 @@ DEFAULT_IDRAC_USER = "root"
 DEFAULT_IDRAC_PASSWORD = "calvin"
 DEFAULT_NIC = "NIC.Integrated.1-1-1"  # This should be adjusted based on your system
 
-def parse_arguments():
+def parse_arguments(argv=None):
     parser = argparse.ArgumentParser(description="Configure iSCSI boot on Dell R630 servers using Dell scripts")
     parser.add_argument("--server", default=DEFAULT_IDRAC_IP, help="Server IP address (e.g., 192.168.2.230)")
     parser.add_argument("--user", default=DEFAULT_IDRAC_USER, help="iDRAC username")
@@ -44,7 +44,7 @@ def parse_arguments():
     parser.add_argument("--validate-only", action="store_true", help="Only validate existing configuration")
     parser.add_argument("--reset-iscsi", action="store_true", help="Reset iSCSI configuration to defaults")
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 def load_targets():
     """Load the iSCSI targets from the configuration file"""
@@ -594,8 +594,8 @@ def list_available_targets():
     print("\nTo configure a target: config_iscsi_boot.py --target <name>")
     print("For multipath configuration: config_iscsi_boot.py --target <primary> --secondary-target <secondary>")
 
-def main():
-    args = parse_arguments()
+def main(argv=None):
+    args = parse_arguments(argv)
     
     # Verify the Dell Redfish script exists
     if not NETWORK_CONFIG_SCRIPT.exists():
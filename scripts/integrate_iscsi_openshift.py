@@ -11,7 +11,10 @@ import uuid
 import requests
 import yaml
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Disable SSL warnings for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -85,6 +88,19 @@ def save_device_mapping(mapping):
     with open(MAPPING_FILE, "w") as f:
         json.dump(mapping, f, indent=2)
 
+def post_deferred(session, url, payload):
+    """POST an iSCSI create asking TrueNAS to defer reloading the iSCSI service
+    
+    The reload then happens once, on the final target-extent association or an
+    explicit reload when no association is created, rather than after every
+    create. Middleware without the defer option rejects it with a 422, in which
+    case the request is repeated without it.
+    """
+    response = session.post(url, json={**payload, "defer": True})
+    if response.status_code == 422 and "defer" in response.text:
+        response = session.post(url, json=payload)
+    return response
+
 def create_iscsi_target(args):
     """Create an iSCSI target on TrueNAS for the specified server using API"""
     print(f"Creating iSCSI target for server {args.hostname} ({args.server_id})...")
@@ -102,6 +118,19 @@ def create_iscsi_target(args):
     session.headers.update({"Authorization": f"Bearer {args.truenas_api_key}"})
     session.verify = False  # For self-signed certs
     
+    # Size the pool for the concurrent target and extent creates below, so both
+    # reuse established connections instead of opening new ones. Transient
+    # gateway errors are retried for the idempotent lookups; creates are not
+    # retried, as a repeated POST could create the resource twice
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    
     # 1. Create zvol
     print(f"Creating zvol {zvol_name} on TrueNAS via API...")
     
@@ -166,79 +195,93 @@ def create_iscsi_target(args):
             if hasattr(e, 'response') and e.response.status_code == 422:
                 print("ZVOL might already exist, continuing anyway")
     
-    # 2. Create iSCSI target
-    print(f"Creating iSCSI target {target_name}...")
-    
-    # Check if target already exists
-    query_url = f"{api_url}/iscsi/target?name={target_name}"
-    query_response = session.get(query_url)
-    
-    if query_response.status_code == 200 and query_response.json():
-        targets = query_response.json()
-        if targets:
+    # 2. and 3. Create the iSCSI target and extent. Neither depends on the other,
+    # so both run concurrently; their output is collected and printed in order
+    def ensure_target():
+        lines = [f"Creating iSCSI target {target_name}..."]
+        created = False
+        
+        # Check if target already exists
+        query_url = f"{api_url}/iscsi/target?name={target_name}"
+        query_response = session.get(query_url)
+        
+        if query_response.status_code == 200 and query_response.json():
+            targets = query_response.json()
             target_id = targets[0]['id']
-            print(f"Target {target_name} already exists with ID {target_id} - reusing")
-    else:
-        # Create the target
-        url = f"{api_url}/iscsi/target"
-        payload = {
-            "name": target_name,
-            "alias": f"OpenShift {args.hostname}",
-            "mode": "ISCSI",
-            "groups": [{"portal": 3, "initiator": 3, "auth": None}]  # Use the correct portal and initiator IDs
-        }
+            lines.append(f"Target {target_name} already exists with ID {target_id} - reusing")
+        else:
+            # Create the target
+            url = f"{api_url}/iscsi/target"
+            payload = {
+                "name": target_name,
+                "alias": f"OpenShift {args.hostname}",
+                "mode": "ISCSI",
+                "groups": [{"portal": 3, "initiator": 3, "auth": None}]  # Use the correct portal and initiator IDs
+            }
+            
+            try:
+                response = post_deferred(session, url, payload)
+                response.raise_for_status()
+                target_id = response.json()['id']
+                created = True
+                lines.append(f"Successfully created target {target_name} with ID {target_id}")
+            except Exception as e:
+                lines.append(f"Error creating iSCSI target: {e}")
+                # Continue with a default target ID for the next steps
+                target_id = 0
+        return target_id, created, lines
+    
+    def ensure_extent():
+        lines = [f"Creating iSCSI extent {extent_name}..."]
+        created = False
         
-        try:
-            response = session.post(url, json=payload)
-            response.raise_for_status()
-            target_id = response.json()['id']
-            print(f"Successfully created target {target_name} with ID {target_id}")
-        except Exception as e:
-            print(f"Error creating iSCSI target: {e}")
-            # Continue with a default target ID for the next steps
-            target_id = 0
-    
-    # 3. Create extent
-    print(f"Creating iSCSI extent {extent_name}...")
-    
-    # Check if extent already exists
-    query_url = f"{api_url}/iscsi/extent?name={extent_name}"
-    query_response = session.get(query_url)
-    
-    if query_response.status_code == 200 and query_response.json():
-        extents = query_response.json()
-        if extents:
-            extent_id = extents[0]['id']
-            print(f"Extent {extent_name} already exists with ID {extent_id} - reusing")
-    else:
-        # Create the extent
-        url = f"{api_url}/iscsi/extent"
-        payload = {
-            "name": extent_name,
-            "type": "DISK",
-            "disk": f"zvol/{zvol_name}",
-            "blocksize": 512,
-            "pblocksize": False,
-            "comment": f"OpenShift {args.hostname} boot image",
-            "insecure_tpc": True,
-            "xen": False,
-            "rpm": "SSD",
-            "ro": False
-        }
+        # Check if extent already exists
+        query_url = f"{api_url}/iscsi/extent?name={extent_name}"
+        query_response = session.get(query_url)
         
-        try:
-            response = session.post(url, json=payload)
-            response.raise_for_status()
-            extent_id = response.json()['id']
-            print(f"Successfully created extent {extent_name} with ID {extent_id}")
-        except Exception as e:
-            print(f"Error creating iSCSI extent: {e}")
-            # Continue with a default extent ID for the next steps
-            extent_id = 0
+        if query_response.status_code == 200 and query_response.json():
+            extents = query_response.json()
+            extent_id = extents[0]['id']
+            lines.append(f"Extent {extent_name} already exists with ID {extent_id} - reusing")
+        else:
+            # Create the extent
+            url = f"{api_url}/iscsi/extent"
+            payload = {
+                "name": extent_name,
+                "type": "DISK",
+                "disk": f"zvol/{zvol_name}",
+                "blocksize": 512,
+                "pblocksize": False,
+                "comment": f"OpenShift {args.hostname} boot image",
+                "insecure_tpc": True,
+                "xen": False,
+                "rpm": "SSD",
+                "ro": False
+            }
+            
+            try:
+                response = post_deferred(session, url, payload)
+                response.raise_for_status()
+                extent_id = response.json()['id']
+                created = True
+                lines.append(f"Successfully created extent {extent_name} with ID {extent_id}")
+            except Exception as e:
+                lines.append(f"Error creating iSCSI extent: {e}")
+                # Continue with a default extent ID for the next steps
+                extent_id = 0
+        return extent_id, created, lines
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {"target": executor.submit(ensure_target), "extent": executor.submit(ensure_extent)}
+        target_id, target_created, target_lines = futures["target"].result()
+        extent_id, extent_created, extent_lines = futures["extent"].result()
+    print("\n".join(target_lines + extent_lines))
     
     # 4. Associate target with extent
     print("Creating target-extent association...")
     
+    association_created = False
+    
     # Check if association already exists
     query_url = f"{api_url}/iscsi/targetextent?target={target_id}&extent={extent_id}"
     query_response = session.get(query_url)
@@ -248,7 +291,8 @@ def create_iscsi_target(args):
         if associations:
             print(f"Target-extent association already exists - skipping")
     else:
-        # Create the association
+        # Create the association; this is not deferred, so it applies the target
+        # and extent created above in a single iSCSI service reload
         url = f"{api_url}/iscsi/targetextent"
         payload = {
             "target": target_id,
@@ -259,10 +303,22 @@ def create_iscsi_target(args):
         try:
             response = session.post(url, json=payload)
             response.raise_for_status()
+            association_created = True
             print(f"Successfully associated target {target_id} with extent {extent_id}")
         except Exception as e:
             print(f"Error creating target-extent association: {e}")
     
+    # A created target or extent deferred its iSCSI reload to the association;
+    # when no association was created, reload explicitly so they still take effect
+    if (target_created or extent_created) and not association_created:
+        print("Reloading iSCSI service to apply deferred changes...")
+        try:
+            reload_response = session.post(f"{api_url}/service/reload", json={"service": "iscsitarget"})
+            reload_response.raise_for_status()
+            print("Successfully reloaded iSCSI service")
+        except Exception as e:
+            print(f"Error reloading iSCSI service: {e}")
+    
     # 5. Make sure iSCSI service is running
     print("Ensuring iSCSI service is running...")
     service_url = f"{api_url}/service/id/iscsitarget"
@@ -8,8 +8,10 @@ import sys
 import os
 import json
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 import urllib3
+from urllib3.util.retry import Retry
 
 # Disable SSL warnings for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -24,6 +26,25 @@ ISCSI_TARGETS_FILE = CONFIG_DIR / "iscsi_targets.json"
 IDRAC_USER = os.environ.get("IDRAC_USER", "root")
 IDRAC_PASSWORD = os.environ.get("IDRAC_PASSWORD", "calvin")
 
+def create_probe_session():
+    """Create a session for availability probes that retries transient failures in urllib3"""
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=2,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared session for ISO/netboot availability probes
+PROBE_SESSION = create_probe_session()
+
 def load_iscsi_targets():
     """Load iSCSI targets from configuration file"""
     try:
@@ -184,12 +205,12 @@ def check_iso_availability(version):
     iso_url = f"http://192.168.2.245/openshift_isos/{version}/agent.x86_64.iso"
     
     try:
-        response = requests.head(iso_url, timeout=5)
+        response = PROBE_SESSION.head(iso_url, timeout=5)
         if response.status_code != 200:
             print(f"Warning: ISO file at {iso_url} may not be accessible (HTTP {response.status_code})")
             return False
         return True
-    except requests.exceptions.RequestException:
+    except (requests.ConnectionError, requests.Timeout):
         print(f"Warning: Unable to verify ISO availability at {iso_url}")
         return False
 
@@ -234,16 +255,16 @@ def check_netboot_connectivity():
     netboot_url = "https://netboot.omnisack.nl/ipxe/netboot.xyz.efi"
     
     try:
-        response = requests.head(netboot_url, timeout=5)
+        response = PROBE_SESSION.head(netboot_url, timeout=5)
         if response.status_code != 200:
             print(f"Warning: Netboot.xyz at {netboot_url} may not be accessible (HTTP {response.status_code})")
             return False
         return True
-    except requests.exceptions.RequestException:
+    except (requests.ConnectionError, requests.Timeout):
         print(f"Warning: Unable to verify netboot.xyz availability at {netboot_url}")
         return False
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Configure OpenShift boot options for Dell R630")
     parser.add_argument("--server", required=True, help="Server IP address (e.g., 192.168.2.230)")
     parser.add_argument("--method", choices=["iscsi", "iso", "netboot"], required=True, help="Boot method")
@@ -260,7 +281,7 @@ def main():
     iscsi_group.add_argument("--validate-iscsi", action="store_true", help="Validate existing iSCSI configuration")
     iscsi_group.add_argument("--reset-iscsi", action="store_true", help="Reset iSCSI configuration to defaults")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     success = False
     
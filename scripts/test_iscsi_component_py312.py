@@ -16,7 +16,11 @@ from typing import Dict, Any, List, Optional, Union, cast
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from framework.py312_helpers import format_results
 
 # Import the Python 3.12 versions of components
 from framework.base_component_py312 import BaseComponent
@@ -34,6 +38,10 @@ def setup_logging() -> logging.Logger:
         A configured logger
     """
     logger = logging.getLogger("iscsi_component_test_py312")
+    
+    if logger.handlers:
+        return logger
+    
     logger.setLevel(logging.DEBUG)
     
     # Create console handler
@@ -169,10 +177,19 @@ def setup_mocked_responses() -> Dict[str, Any]:
 class MockResponse:
     """Mock requests.Response for testing"""
     
+    __slots__ = ('json_data', 'status_code', '_text')
+    
     def __init__(self, json_data, status_code=200, text=None):
         self.json_data = json_data
         self.status_code = status_code
-        self.text = text if text is not None else json.dumps(json_data)
+        self._text = text
+    
+    @property
+    def text(self):
+        # Serialised on first access only; most callers never read it
+        if self._text is None:
+            self._text = json.dumps(self.json_data)
+        return self._text
     
     def json(self):
         return self.json_data
@@ -300,14 +317,15 @@ def test_iscsi_component_with_mocks() -> None:
         iscsi_component = ISCSIComponent(config, logger)
         
         # Ensure resources are named correctly
-        logger.info(f"Resource names: zvol={iscsi_component.config.get('zvol_name')}, "
-                    f"target={iscsi_component.config.get('target_name')}, "
-                    f"extent={iscsi_component.config.get('extent_name')}")
+        logger.info("Resource names: zvol=%s, target=%s, extent=%s",
+                    iscsi_component.config.get('zvol_name'),
+                    iscsi_component.config.get('target_name'),
+                    iscsi_component.config.get('extent_name'))
         
         # Run discovery phase
         logger.info("Running discovery phase...")
         discovery_results = iscsi_component.discover()
-        logger.info(f"Discovery completed: connectivity={discovery_results.get('connectivity')}")
+        logger.info("Discovery completed: connectivity=%s", discovery_results.get('connectivity'))
         
         # Check discovery results
         if discovery_results.get('connectivity', False):
@@ -315,19 +333,19 @@ def test_iscsi_component_with_mocks() -> None:
             
             if discovery_results.get('pools'):
                 pool_count = len(discovery_results.get('pools', []))
-                logger.info(f"✅ Found {pool_count} storage pools")
+                logger.info("✅ Found %s storage pools", pool_count)
             
             if discovery_results.get('zvols'):
                 zvol_count = len(discovery_results.get('zvols', []))
-                logger.info(f"✅ Found {zvol_count} existing zvols")
+                logger.info("✅ Found %s existing zvols", zvol_count)
             
             if discovery_results.get('targets'):
                 target_count = len(discovery_results.get('targets', []))
-                logger.info(f"✅ Found {target_count} iSCSI targets")
+                logger.info("✅ Found %s iSCSI targets", target_count)
             
             if discovery_results.get('extents'):
                 extent_count = len(discovery_results.get('extents', []))
-                logger.info(f"✅ Found {extent_count} iSCSI extents")
+                logger.info("✅ Found %s iSCSI extents", extent_count)
             
             if discovery_results.get('iscsi_service'):
                 logger.info("✅ iSCSI service is running")
@@ -352,13 +370,13 @@ def test_iscsi_component_with_mocks() -> None:
         
         if processing_results.get('target_created'):
             target_id = processing_results.get('target_id')
-            logger.info(f"✅ Created/reused target with ID {target_id}")
+            logger.info("✅ Created/reused target with ID %s", target_id)
         else:
             logger.warning("⚠️ Failed to create target")
         
         if processing_results.get('extent_created'):
             extent_id = processing_results.get('extent_id')
-            logger.info(f"✅ Created/reused extent with ID {extent_id}")
+            logger.info("✅ Created/reused extent with ID %s", extent_id)
         else:
             logger.warning("⚠️ Failed to create extent")
         
@@ -377,7 +395,7 @@ def test_iscsi_component_with_mocks() -> None:
         else:
             logger.warning("⚠️ Some resources could not be verified")
             for warning in housekeeping_results.get('warnings', []):
-                logger.warning(f"  - {warning}")
+                logger.warning("  - %s", warning)
         
         # Demonstrate resource details
         resource_details = {
@@ -393,7 +411,8 @@ def test_iscsi_component_with_mocks() -> None:
             }
         }
         
-        logger.info(f"iSCSI Resource Details:\n{json.dumps(resource_details, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("iSCSI Resource Details:\n%s", format_results(resource_details))
         
         logger.info("iSCSI component test completed successfully")
         
@@ -422,12 +441,12 @@ def test_iscsi_utils() -> None:
     
     for size_str, expected_bytes in sizes.items():
         result = iscsi_component._format_size(size_str)
-        logger.info(f"Format size '{size_str}' = {result} bytes")
+        logger.info("Format size '%s' = %s bytes", size_str, result)
         
         if result == expected_bytes:
-            logger.info(f"✅ Size formatting correct for '{size_str}'")
+            logger.info("✅ Size formatting correct for '%s'", size_str)
         else:
-            logger.warning(f"⚠️ Size formatting failed for '{size_str}': got {result}, expected {expected_bytes}")
+            logger.warning("⚠️ Size formatting failed for '%s': got %s, expected %s", size_str, result, expected_bytes)
     
     logger.info("Utility function tests completed")
 
@@ -2,7 +2,11 @@
 # test_iscsi_redfish.py - Test script for enhanced iSCSI Redfish configuration
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import os
+import shutil
 import sys
 import json
 import subprocess
@@ -14,25 +18,55 @@ CONFIG_DIR = SCRIPT_DIR.parent / "config"
 ISCSI_CONFIG_SCRIPT = SCRIPT_DIR / "config_iscsi_boot.py"
 SWITCH_SCRIPT = SCRIPT_DIR / "switch_openshift.py"
 
+# Add parent directory to path so the sibling scripts can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from scripts import config_iscsi_boot, switch_openshift
+
+# Entry points used to run the scripts in this interpreter instead of a child process
+ENTRY_POINTS = {
+    ISCSI_CONFIG_SCRIPT: config_iscsi_boot.main,
+    SWITCH_SCRIPT: switch_openshift.main,
+}
+
 # Default values
 DEFAULT_IDRAC_IP = "192.168.2.230"
 DEFAULT_IDRAC_USER = "root"
 DEFAULT_IDRAC_PASSWORD = "calvin"
 DEFAULT_NIC = "NIC.Integrated.1-1-1"
+DEFAULT_OCP_VERSION = "4.18"
 
-def parse_arguments():
+def parse_test_list(value):
+    """Parse a comma-separated list of test names"""
+    tests = [t.strip() for t in value.split(",") if t.strip()]
+    unknown = [t for t in tests if t not in TESTS]
+    if not tests or unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid test selection {value!r} (choose from {', '.join(TESTS)})"
+        )
+    return tests
+
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the argument parser once"""
     parser = argparse.ArgumentParser(description="Test enhanced iSCSI Redfish configuration options")
     parser.add_argument("--server", default=DEFAULT_IDRAC_IP, help="Server IP address (e.g., 192.168.2.230)")
     parser.add_argument("--user", default=DEFAULT_IDRAC_USER, help="iDRAC username")
     parser.add_argument("--password", default=DEFAULT_IDRAC_PASSWORD, help="iDRAC password")
     parser.add_argument("--nic", default=DEFAULT_NIC, help="NIC to configure for iSCSI boot")
-    parser.add_argument("--test", choices=["basic", "multipath", "chap", "direct-api", "validate", "reset"], 
-                      required=True, help="Test to run")
+    parser.add_argument("--test", type=parse_test_list, required=True,
+                      help=f"Test(s) to run, comma-separated for concurrent runs ({', '.join(TESTS)})")
     parser.add_argument("--reboot", action="store_true", help="Reboot after configuration")
-    parser.add_argument("--ocp-version", default="4.18", help="OpenShift version for testing")
+    parser.add_argument("--ocp-version", default=DEFAULT_OCP_VERSION, help="OpenShift version for testing")
     parser.add_argument("--dry-run", action="store_true", help="Show commands but don't run them")
+    parser.add_argument("--isolate", action="store_true",
+                      help="Run a single test's script in a separate Python process instead of in-process "
+                           "(concurrent tests always run in separate processes)")
     
-    return parser.parse_args()
+    return parser
+
+def parse_arguments(argv=None):
+    return _get_parser().parse_args(argv)
 
 def run_command(cmd, dry_run=False):
     """Run a command and print its output"""
@@ -43,16 +77,68 @@ def run_command(cmd, dry_run=False):
         print("(Dry run - command not executed)")
         return True
     
-    try:
-        result = subprocess.run(cmd, check=True, text=True, capture_output=True)
-        print(result.stdout)
+    # Stream merged stdout/stderr line by line so long Redfish operations show progress
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        returncode = proc.wait()
+    
+    if returncode != 0:
+        print(f"Error: Command '{cmd_str}' returned non-zero exit status {returncode}.")
+        return False
+    return True
+
+async def run_command_async(cmd, dry_run=False):
+    """Run a command without blocking the event loop and print its output"""
+    cmd_str = " ".join(cmd)
+    print(f"\nRunning: {cmd_str}")
+    
+    if dry_run:
+        print("(Dry run - command not executed)")
         return True
-    except subprocess.CalledProcessError as e:
+    
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        print(f"Error: Command '{cmd_str}' returned non-zero exit status {proc.returncode}.")
+        print(f"STDERR: {stderr.decode(errors='replace')}")
+        return False
+    
+    print(stdout.decode(errors="replace"))
+    return True
+
+def run_in_process(cmd, dry_run=False):
+    """Run a script command by calling the script's main() in this interpreter"""
+    cmd_str = " ".join(cmd)
+    print(f"\nRunning in-process: {cmd_str}")
+    
+    if dry_run:
+        print("(Dry run - command not executed)")
+        return True
+    
+    entry_point = ENTRY_POINTS[Path(cmd[1])]
+    try:
+        entry_point(cmd[2:])
+        returncode = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            returncode = e.code or 0
+        else:
+            print(e.code)
+            returncode = 1
+    except Exception as e:
         print(f"Error: {e}")
-        print(f"STDERR: {e.stderr}")
         return False
+    
+    if returncode != 0:
+        print(f"Error: Command '{cmd_str}' exited with status {returncode}.")
+        return False
+    return True
 
-def test_basic_config(args):
+def test_basic_config(args, runner=run_command):
     """Test basic iSCSI configuration"""
     print("\n=== Testing Basic iSCSI Configuration ===")
     
@@ -67,9 +153,9 @@ def test_basic_config(args):
     if args.reboot:
         cmd.append("--reboot")
     
-    return run_command(cmd, args.dry_run)
+    return runner(cmd, args.dry_run)
 
-def test_multipath_config(args):
+def test_multipath_config(args, runner=run_command):
     """Test multipath iSCSI configuration"""
     print("\n=== Testing Multipath iSCSI Configuration ===")
     
@@ -85,9 +171,9 @@ def test_multipath_config(args):
     if args.reboot:
         cmd.append("--reboot")
     
-    return run_command(cmd, args.dry_run)
+    return runner(cmd, args.dry_run)
 
-def test_chap_config(args):
+def test_chap_config(args, runner=run_command):
     """Test CHAP authentication configuration"""
     print("\n=== Testing CHAP Authentication ===")
     
@@ -103,9 +189,9 @@ def test_chap_config(args):
     if not args.reboot:
         cmd.append("--no-reboot")
     
-    return run_command(cmd, args.dry_run)
+    return runner(cmd, args.dry_run)
 
-def test_direct_api(args):
+def test_direct_api(args, runner=run_command):
     """Test direct Redfish API configuration"""
     print("\n=== Testing Direct Redfish API ===")
     
@@ -121,9 +207,9 @@ def test_direct_api(args):
     if args.reboot:
         cmd.append("--reboot")
     
-    return run_command(cmd, args.dry_run)
+    return runner(cmd, args.dry_run)
 
-def test_validate_config(args):
+def test_validate_config(args, runner=run_command):
     """Test validation of existing configuration"""
     print("\n=== Testing iSCSI Configuration Validation ===")
     
@@ -136,9 +222,9 @@ def test_validate_config(args):
         "--validate-iscsi"
     ]
     
-    return run_command(cmd, args.dry_run)
+    return runner(cmd, args.dry_run)
 
-def test_reset_config(args):
+def test_reset_config(args, runner=run_command):
     """Test resetting iSCSI configuration"""
     print("\n=== Testing iSCSI Configuration Reset ===")
     
@@ -154,7 +240,17 @@ def test_reset_config(args):
     if args.reboot:
         cmd.append("--reboot")
     
-    return run_command(cmd, args.dry_run)
+    return runner(cmd, args.dry_run)
+
+# Tests that can be selected with --test, keyed by name
+TESTS = {
+    "basic": test_basic_config,
+    "multipath": test_multipath_config,
+    "chap": test_chap_config,
+    "direct-api": test_direct_api,
+    "validate": test_validate_config,
+    "reset": test_reset_config,
+}
 
 def verify_script_exists(script_path):
     """Verify that script exists"""
@@ -163,7 +259,12 @@ def verify_script_exists(script_path):
         return False
     return True
 
-def verify_enhanced_targets_exists():
+def file_sha256(path):
+    """Return the SHA-256 hex digest of a file"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def verify_enhanced_targets_exists(dry_run=False):
     """Verify enhanced targets file exists and copy it to the standard location if needed"""
     enhanced_targets = CONFIG_DIR / "iscsi_targets_enhanced.json"
     standard_targets = CONFIG_DIR / "iscsi_targets.json"
@@ -173,25 +274,53 @@ def verify_enhanced_targets_exists():
         print(f"Error: Enhanced targets file not found at {enhanced_targets}")
         return False
     
+    # Leave the targets files untouched in dry-run mode
+    if dry_run:
+        print(f"(Dry run - would copy {enhanced_targets} to {standard_targets})")
+        return True
+    
+    # Nothing to do when the standard file already matches the enhanced one
+    if standard_targets.exists() and file_sha256(standard_targets) == file_sha256(enhanced_targets):
+        print(f"{standard_targets} already matches {enhanced_targets}")
+        return True
+    
     # Make a backup of the standard targets file if it exists
     if standard_targets.exists():
         try:
-            import shutil
             shutil.copy2(standard_targets, standard_targets_backup)
             print(f"Made backup of {standard_targets} to {standard_targets_backup}")
         except Exception as e:
             print(f"Warning: Unable to backup targets file: {e}")
     
-    # Copy the enhanced targets file to the standard location
+    # Copy the enhanced targets file next to the standard location and swap it in,
+    # so the standard file is only replaced once the copy has completed
+    staged_targets = CONFIG_DIR / "iscsi_targets.json.tmp"
     try:
-        import shutil
-        shutil.copy2(enhanced_targets, standard_targets)
+        shutil.copy2(enhanced_targets, staged_targets)
+        os.replace(staged_targets, standard_targets)
         print(f"Copied enhanced targets from {enhanced_targets} to {standard_targets}")
         return True
     except Exception as e:
+        staged_targets.unlink(missing_ok=True)
         print(f"Error: Unable to copy enhanced targets file: {e}")
         return False
 
+async def run_tests_concurrently(args, tests, runner):
+    """Run the selected tests concurrently and report whether all of them passed"""
+    results = await asyncio.gather(
+        *(test(args, runner) for test in tests), return_exceptions=True
+    )
+    
+    success = True
+    for test, result in zip(tests, results):
+        if isinstance(result, BaseException):
+            print(f"Error: {test.__name__} raised {result!r}")
+            success = False
+        elif not result:
+            print(f"Error: {test.__name__} failed")
+            success = False
+    return success
+
 def main():
     args = parse_arguments()
     
@@ -200,25 +329,18 @@ def main():
         sys.exit(1)
     
     # Verify enhanced targets exist and copy to standard location
-    if not verify_enhanced_targets_exists():
+    if not verify_enhanced_targets_exists(args.dry_run):
         print("Error: Enhanced targets file not available or couldn't be copied")
         sys.exit(1)
     
-    # Run the selected test
-    success = False
-    
-    if args.test == "basic":
-        success = test_basic_config(args)
-    elif args.test == "multipath":
-        success = test_multipath_config(args)
-    elif args.test == "chap":
-        success = test_chap_config(args)
-    elif args.test == "direct-api":
-        success = test_direct_api(args)
-    elif args.test == "validate":
-        success = test_validate_config(args)
-    elif args.test == "reset":
-        success = test_reset_config(args)
+    # Run a single test synchronously; run several concurrently. Concurrent tests
+    # use child processes so each test's output is collected and printed as one
+    # block, which in-process runs sharing sys.stdout cannot do
+    if len(args.test) == 1:
+        runner = run_command if args.isolate else run_in_process
+        success = TESTS[args.test[0]](args, runner)
+    else:
+        success = asyncio.run(run_tests_concurrently(args, [TESTS[t] for t in args.test], run_command_async))
     
     if success:
         print("\n✅ Test completed successfully.")
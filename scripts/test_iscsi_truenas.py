@@ -11,8 +11,8 @@ import os
 import sys
 import logging
 import argparse
+import functools
 import getpass
-from pprint import pformat
 
 # Add project root to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,6 +20,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import components
 from framework.components.iscsi_component import ISCSIComponent
 
+# keyring is optional; without it the API key is prompted for on every run
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+# Keyring service name under which API keys are cached per TrueNAS host
+KEYRING_SERVICE = "truenas"
+
+# Multiply byte counts by this to get GB
+_INV_GB = 1.0 / (1024.0 ** 3)
+
 def setup_logging(verbose=False):
     """Set up logging configuration"""
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -32,8 +44,9 @@ def setup_logging(verbose=False):
     )
     return logging.getLogger("iscsi-test")
 
-def parse_arguments():
-    """Parse command line arguments"""
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the argument parser once"""
     parser = argparse.ArgumentParser(description="Test ISCSIComponent with TrueNAS")
     
     # TrueNAS connection configuration
@@ -56,7 +69,43 @@ def parse_arguments():
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--dry-run", action="store_true", help="Dry run (no changes)")
     
-    return parser.parse_args()
+    return parser
+
+def parse_arguments():
+    """Parse command line arguments"""
+    return _get_parser().parse_args()
+
+def get_api_key(args, logger):
+    """Get the TrueNAS API key from the command line, the OS keyring or a prompt
+    
+    Returns the key and whether it was prompted for.
+    """
+    if args.api_key:
+        return args.api_key, False
+    
+    if keyring is not None:
+        try:
+            api_key = keyring.get_password(KEYRING_SERVICE, args.truenas_ip)
+            if api_key:
+                return api_key, False
+        except keyring.errors.KeyringError as e:
+            logger.debug("Unable to read API key from keyring: %s", e)
+    
+    return getpass.getpass("Enter TrueNAS API key: "), True
+
+def update_keyring(args, api_key, prompted, discovery_results, logger):
+    """Store a prompted API key once TrueNAS accepts it, and drop one it rejects with a 401"""
+    if keyring is None or args.api_key:
+        return
+    
+    try:
+        if discovery_results.get('connectivity', False):
+            if prompted and api_key:
+                keyring.set_password(KEYRING_SERVICE, args.truenas_ip, api_key)
+        elif discovery_results.get('connection_error', '').startswith('401 '):
+            keyring.delete_password(KEYRING_SERVICE, args.truenas_ip)
+    except keyring.errors.KeyringError as e:
+        logger.debug("Unable to update API key in keyring: %s", e)
 
 def main():
     """Main function"""
@@ -64,9 +113,7 @@ def main():
     logger = setup_logging(args.verbose)
     
     # Get API key if not provided
-    api_key = args.api_key
-    if not api_key:
-        api_key = getpass.getpass("Enter TrueNAS API key: ")
+    api_key, prompted = get_api_key(args, logger)
     
     # Configure ISCSIComponent
     iscsi_config = {
@@ -81,76 +128,77 @@ def main():
         'discover_only': args.discover_only
     }
     
-    logger.info(f"Initializing ISCSIComponent for TrueNAS at {args.truenas_ip}")
+    logger.info("Initializing ISCSIComponent for TrueNAS at %s", args.truenas_ip)
     iscsi_component = ISCSIComponent(iscsi_config, logger)
     
     # Discovery phase
     logger.info("Starting discovery phase...")
     try:
         discovery_results = iscsi_component.discover()
+        update_keyring(args, api_key, prompted, discovery_results, logger)
+        connectivity = discovery_results.get('connectivity', False)
+        pools = discovery_results.get('pools', ())
+        zvols = discovery_results.get('zvols', ())
+        targets = discovery_results.get('targets', ())
+        storage_capacity = discovery_results.get('storage_capacity', {})
         
         # Display discovery results
         logger.info("Discovery completed:")
-        logger.info(f"- TrueNAS connectivity: {discovery_results.get('connectivity', False)}")
-        logger.info(f"- iSCSI service running: {discovery_results.get('iscsi_service', False)}")
+        logger.info("- TrueNAS connectivity: %s", connectivity)
+        logger.info("- iSCSI service running: %s", discovery_results.get('iscsi_service', False))
         
         # Display pools
-        pools = discovery_results.get('pools', [])
         if pools:
-            logger.info(f"Found {len(pools)} storage pools:")
-            for pool in pools:
-                pool_name = pool.get('name')
-                free_bytes = pool.get('free', 0)
-                free_gb = free_bytes / (1024**3)
-                logger.info(f"  - {pool_name} ({free_gb:.1f} GB free)")
+            pool_lines = "\n".join(
+                f"  - {pool.get('name')} ({pool.get('free', 0) * _INV_GB:.1f} GB free)"
+                for pool in pools
+            )
+            logger.info("Found %d storage pools:\n%s", len(pools), pool_lines)
         else:
             logger.warning("No storage pools found")
         
         # Display existing zvols
-        zvols = discovery_results.get('zvols', [])
         if zvols:
-            logger.info(f"Found {len(zvols)} existing zvols:")
-            for zvol in zvols:
-                zvol_name = zvol.get('name')
-                zvol_size = zvol.get('volsize', {}).get('parsed', 0)
-                zvol_size_gb = zvol_size / (1024**3)
-                logger.info(f"  - {zvol_name} ({zvol_size_gb:.1f} GB)")
+            zvol_lines = "\n".join(
+                f"  - {zvol.get('name')} ({zvol.get('volsize', {}).get('parsed', 0) * _INV_GB:.1f} GB)"
+                for zvol in zvols
+            )
+            logger.info("Found %d existing zvols:\n%s", len(zvols), zvol_lines)
         else:
             logger.info("No existing zvols found")
         
         # Display existing targets
-        targets = discovery_results.get('targets', [])
         if targets:
-            logger.info(f"Found {len(targets)} existing iSCSI targets:")
-            for target in targets:
-                target_id = target.get('id')
-                target_name = target.get('name')
-                logger.info(f"  - {target_name} (ID: {target_id})")
+            target_lines = "\n".join(
+                f"  - {target.get('name')} (ID: {target.get('id')})"
+                for target in targets
+            )
+            logger.info("Found %d existing iSCSI targets:\n%s", len(targets), target_lines)
         else:
             logger.info("No existing iSCSI targets found")
         
         # Check if connectivity failed
-        if not discovery_results.get('connectivity', False):
+        if not connectivity:
             logger.error("TrueNAS connectivity failed - cannot proceed with tests")
-            if 'connection_error' in discovery_results:
-                logger.error(f"Error: {discovery_results['connection_error']}")
+            connection_error = discovery_results.get('connection_error')
+            if connection_error is not None:
+                logger.error("Error: %s", connection_error)
             return 1
         
         # Check storage capacity
-        storage_capacity = discovery_results.get('storage_capacity', {})
         if storage_capacity:
             if 'error' in storage_capacity:
-                logger.error(f"Storage capacity check failed: {storage_capacity['error']}")
+                logger.error("Storage capacity check failed: %s", storage_capacity['error'])
             elif not storage_capacity.get('found', True):
-                logger.error(f"ZFS pool '{args.zfs_pool}' not found")
+                logger.error("ZFS pool '%s' not found", args.zfs_pool)
             elif 'sufficient' in storage_capacity:
                 if storage_capacity['sufficient']:
-                    logger.info(f"Storage capacity is sufficient for test zvol")
+                    logger.info("Storage capacity is sufficient for test zvol")
                 else:
-                    logger.warning(f"Storage capacity may be insufficient for test zvol")
-                    free_gb = storage_capacity.get('free_bytes', 0) / (1024**3)
-                    required_gb = storage_capacity.get('required_bytes', 0) / (1024**3)
-                    logger.warning(f"  Required: {required_gb:.1f} GB, Available: {free_gb:.1f} GB")
+                    logger.warning("Storage capacity may be insufficient for test zvol")
+                    free_gb = storage_capacity.get('free_bytes', 0) * _INV_GB
+                    required_gb = storage_capacity.get('required_bytes', 0) * _INV_GB
+                    logger.warning("  Required: %.1f GB, Available: %.1f GB", required_gb, free_gb)
         
         # Stop here if only discovery requested
         if args.discover_only:
@@ -164,21 +212,21 @@ def main():
                 processing_results = iscsi_component.process()
                 
                 logger.info("Processing results:")
-                logger.info(f"- Zvol created: {processing_results.get('zvol_created', False)}")
-                logger.info(f"- Target created: {processing_results.get('target_created', False)}")
-                logger.info(f"- Extent created: {processing_results.get('extent_created', False)}")
-                logger.info(f"- Association created: {processing_results.get('association_created', False)}")
+                logger.info("- Zvol created: %s", processing_results.get('zvol_created', False))
+                logger.info("- Target created: %s", processing_results.get('target_created', False))
+                logger.info("- Extent created: %s", processing_results.get('extent_created', False))
+                logger.info("- Association created: %s", processing_results.get('association_created', False))
                 
                 if processing_results.get('target_id'):
-                    logger.info(f"- Target ID: {processing_results.get('target_id')}")
+                    logger.info("- Target ID: %s", processing_results.get('target_id'))
                 if processing_results.get('extent_id'):
-                    logger.info(f"- Extent ID: {processing_results.get('extent_id')}")
+                    logger.info("- Extent ID: %s", processing_results.get('extent_id'))
                 
                 # Display error messages if any component failed
                 for component in ['zvol', 'target', 'extent', 'association']:
                     error_key = f"{component}_error"
                     if error_key in processing_results:
-                        logger.error(f"{component.capitalize()} creation error: {processing_results[error_key]}")
+                        logger.error("%s creation error: %s", component.capitalize(), processing_results[error_key])
                 
                 # Housekeeping phase - verify and clean up
                 if args.cleanup:
@@ -186,23 +234,23 @@ def main():
                     housekeeping_results = iscsi_component.housekeep()
                     
                     logger.info("Housekeeping results:")
-                    logger.info(f"- Resources verified: {housekeeping_results.get('resources_verified', False)}")
-                    logger.info(f"- Unused resources found: {housekeeping_results.get('unused_resources_found', 0)}")
-                    logger.info(f"- Unused resources cleaned: {housekeeping_results.get('unused_resources_cleaned', 0)}")
+                    logger.info("- Resources verified: %s", housekeeping_results.get('resources_verified', False))
+                    logger.info("- Unused resources found: %s", housekeeping_results.get('unused_resources_found', 0))
+                    logger.info("- Unused resources cleaned: %s", housekeeping_results.get('unused_resources_cleaned', 0))
                     
                     # Display warnings if any
                     warnings = housekeeping_results.get('warnings', [])
                     if warnings:
-                        logger.warning(f"Housekeeping warnings:")
+                        logger.warning("Housekeeping warnings:")
                         for warning in warnings:
-                            logger.warning(f"  - {warning}")
+                            logger.warning("  - %s", warning)
             
             except Exception as e:
-                logger.error(f"Error during testing: {str(e)}")
+                logger.error("Error during testing: %s", e)
                 return 1
     
     except Exception as e:
-        logger.error(f"Error during discovery: {str(e)}")
+        logger.error("Error during discovery: %s", e)
         return 1
     
     logger.info("TrueNAS iSCSI component test completed successfully")
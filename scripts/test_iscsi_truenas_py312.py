@@ -9,21 +9,47 @@ a test zvol to verify the full functionality.
 Python 3.12 version with enhanced typing and features.
 """
 
-import os
 import sys
+import json
+import time
+import hashlib
 import logging
+import logging.handlers
 import argparse
 import getpass
-from pprint import pformat
 from pathlib import Path
-from typing import Dict, Any, Optional, List, TypedDict, Literal, cast, NotRequired, Set
+from typing import Dict, Any, Optional, List, TypedDict, cast, NotRequired
 
 # Add project root to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import Python 3.12 components
 from framework.components.iscsi_component_py312 import ISCSIComponent
 
+# keyring is optional; without it the API key is prompted for on every run
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+# Keyring service name under which API keys are cached per TrueNAS host
+KEYRING_SERVICE = "truenas"
+
+# Discovery results are cached here between runs against the same TrueNAS pool
+DISCOVERY_CACHE_DIR = Path.home() / ".cache" / "r630-switchbot"
+DEFAULT_CACHE_TTL = 0
+
+# Multiply by this instead of dividing by 1024**3 when converting bytes to GB
+_INV_GIB: float = 1.0 / (1024 ** 3)
+
+# Processing result keys that carry per-resource creation errors, with their labels
+_ERROR_KEYS = (
+    ('zvol_error', 'Zvol'),
+    ('target_error', 'Target'),
+    ('extent_error', 'Extent'),
+    ('association_error', 'Association'),
+)
+
 
 # Type definitions
 class ISCSIConfigDict(TypedDict):
@@ -110,11 +136,15 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
         Configured logger instance
     """
     log_level = logging.DEBUG if verbose else logging.INFO
+    
+    # Buffer records and write them in batches; errors are written out immediately,
+    # and logging's exit hook flushes whatever is left
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.StreamHandler()
+            logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=stream_handler)
         ]
     )
     return logging.getLogger("iscsi-test")
@@ -197,10 +227,70 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true", 
         help="Dry run (no changes)"
     )
+    parser.add_argument(
+        "--cache-ttl", 
+        type=int, 
+        default=DEFAULT_CACHE_TTL, 
+        help=f"With --discover-only, reuse cached discovery results younger than this many seconds (0 disables, default: {DEFAULT_CACHE_TTL})"
+    )
     
     return parser.parse_args()
 
 
+def get_api_key(args: argparse.Namespace, logger: logging.Logger) -> tuple[str, bool]:
+    """
+    Get the TrueNAS API key from the command line, the OS keyring or a prompt.
+    
+    Args:
+        args: Parsed command line arguments
+        logger: Logger instance
+        
+    Returns:
+        TrueNAS API key and whether it was prompted for
+    """
+    if args.api_key:
+        return args.api_key, False
+    
+    if keyring is not None:
+        try:
+            if api_key := keyring.get_password(KEYRING_SERVICE, args.truenas_ip):
+                return api_key, False
+        except keyring.errors.KeyringError as e:
+            logger.debug("Unable to read API key from keyring: %s", e)
+    
+    return getpass.getpass("Enter TrueNAS API key: "), True
+
+
+def update_keyring(args: argparse.Namespace, api_key: str, prompted: bool,
+                   discovery_results: ISCSIDiscoveryResult, logger: logging.Logger) -> None:
+    """
+    Keep the keyring entry in line with what TrueNAS made of the API key.
+    
+    A prompted key is stored once discovery has connected with it, so later
+    runs are non-interactive; a key TrueNAS rejects with a 401 is removed so
+    the next run prompts again instead of reusing it.
+    
+    Args:
+        args: Parsed command line arguments
+        api_key: TrueNAS API key used for discovery
+        prompted: Whether the key was prompted for
+        discovery_results: Live discovery results
+        logger: Logger instance
+    """
+    if keyring is None or args.api_key:
+        return
+    
+    try:
+        if discovery_results.get('connectivity', False):
+            if prompted and api_key:
+                keyring.set_password(KEYRING_SERVICE, args.truenas_ip, api_key)
+        elif discovery_results.get('connection_error', '').startswith('401 '):
+            keyring.delete_password(KEYRING_SERVICE, args.truenas_ip)
+    except keyring.errors.KeyringError as e:
+        # Also covers PasswordDeleteError when a prompted key was never stored
+        logger.debug("Unable to update API key in keyring: %s", e)
+
+
 def create_iscsi_config(args: argparse.Namespace, api_key: str) -> ISCSIConfigDict:
     """
     Create ISCSI component configuration from command line arguments.
@@ -213,7 +303,7 @@ def create_iscsi_config(args: argparse.Namespace, api_key: str) -> ISCSIConfigDi
         ISCSIConfigDict: ISCSIComponent configuration
     """
     # Create the configuration dictionary
-    base_config: Dict[str, Any] = {
+    config: ISCSIConfigDict = {
         'truenas_ip': args.truenas_ip,
         'api_key': api_key,
         'server_id': args.server_id,
@@ -225,8 +315,58 @@ def create_iscsi_config(args: argparse.Namespace, api_key: str) -> ISCSIConfigDi
         'discover_only': args.discover_only
     }
     
-    # Return with proper typing
-    return cast(ISCSIConfigDict, base_config)
+    return config
+
+
+def discovery_cache_path(args: argparse.Namespace) -> Path:
+    """
+    Get the discovery cache file for a TrueNAS instance and pool.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Path to the cache file
+    """
+    key = hashlib.sha256(f"{args.truenas_ip}\0{args.zfs_pool}".encode()).hexdigest()[:16]
+    return DISCOVERY_CACHE_DIR / f"discovery-{key}.json"
+
+
+def load_cached_discovery(cache_path: Path, ttl: int) -> Optional[ISCSIDiscoveryResult]:
+    """
+    Load discovery results from the cache if they are fresh enough.
+    
+    Args:
+        cache_path: Path to the cache file
+        ttl: Maximum age of the cache in seconds
+        
+    Returns:
+        Cached discovery results, or None on a miss
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime >= ttl:
+            return None
+        with open(cache_path) as f:
+            cached: ISCSIDiscoveryResult = json.load(f)
+        return cached
+    except (OSError, ValueError):
+        return None
+
+
+def store_discovery(cache_path: Path, discovery_results: ISCSIDiscoveryResult) -> None:
+    """
+    Write discovery results to the cache, ignoring filesystem errors.
+    
+    Args:
+        cache_path: Path to the cache file
+        discovery_results: Results from ISCSIComponent discovery
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump(discovery_results, f)
+    except (OSError, TypeError):
+        pass
 
 
 def display_discovery_results(discovery_results: ISCSIDiscoveryResult, args: argparse.Namespace, logger: logging.Logger) -> None:
@@ -240,61 +380,56 @@ def display_discovery_results(discovery_results: ISCSIDiscoveryResult, args: arg
     """
     # Display basic connectivity results
     logger.info("Discovery completed:")
-    logger.info(f"- TrueNAS connectivity: {discovery_results.get('connectivity', False)}")
-    logger.info(f"- iSCSI service running: {discovery_results.get('iscsi_service', False)}")
+    logger.info("- TrueNAS connectivity: %s", discovery_results.get('connectivity', False))
+    logger.info("- iSCSI service running: %s", discovery_results.get('iscsi_service', False))
     
     # Check if connectivity failed
     if not discovery_results.get('connectivity', False):
         if error := discovery_results.get('connection_error'):
-            logger.error(f"TrueNAS connectivity failed: {error}")
+            logger.error("TrueNAS connectivity failed: %s", error)
         else:
             logger.error("TrueNAS connectivity failed - no specific error message available")
         return
     
-    # Display pools using pattern matching
+    # Display pools
     if pools := discovery_results.get('pools', []):
-        logger.info(f"Found {len(pools)} storage pools:")
-        for pool in pools:
-            # Use Python 3.12 pattern matching to handle different pool structures
-            match pool:
-                case {'name': name, 'free': free_bytes}:
-                    free_gb = free_bytes / (1024**3)
-                    logger.info(f"  - {name} ({free_gb:.1f} GB free)")
-                case {'name': name}:
-                    logger.info(f"  - {name} (free space unknown)")
-                case _:
-                    logger.info(f"  - {pool}")
+        if logger.isEnabledFor(logging.INFO):
+            lines: List[str] = []
+            for pool in pools:
+                name = pool.get('name') or str(pool)
+                if (free_bytes := pool.get('free')) is not None:
+                    lines.append(f"  - {name} ({free_bytes * _INV_GIB:.1f} GB free)")
+                else:
+                    lines.append(f"  - {name} (free space unknown)")
+            logger.info("Found %d storage pools:\n%s", len(pools), "\n".join(lines))
     else:
         logger.warning("No storage pools found")
     
-    # Display existing zvols with pattern matching
+    # Display existing zvols
     if zvols := discovery_results.get('zvols', []):
-        logger.info(f"Found {len(zvols)} existing zvols:")
-        for zvol in zvols:
-            # Use pattern matching to handle different zvol structures
-            match zvol:
-                case {'name': name, 'volsize': {'parsed': size}}:
-                    size_gb = size / (1024**3)
-                    logger.info(f"  - {name} ({size_gb:.1f} GB)")
-                case {'name': name}:
-                    logger.info(f"  - {name} (size unknown)")
-                case _:
-                    logger.info(f"  - {zvol}")
+        if logger.isEnabledFor(logging.INFO):
+            lines = []
+            for zvol in zvols:
+                name = zvol.get('name') or str(zvol)
+                if (size := (zvol.get('volsize') or {}).get('parsed')) is not None:
+                    lines.append(f"  - {name} ({size * _INV_GIB:.1f} GB)")
+                else:
+                    lines.append(f"  - {name} (size unknown)")
+            logger.info("Found %d existing zvols:\n%s", len(zvols), "\n".join(lines))
     else:
         logger.info("No existing zvols found")
     
     # Display existing targets
     if targets := discovery_results.get('targets', []):
-        logger.info(f"Found {len(targets)} existing iSCSI targets:")
-        for target in targets:
-            # Use pattern matching for target info
-            match target:
-                case {'id': target_id, 'name': name}:
-                    logger.info(f"  - {name} (ID: {target_id})")
-                case {'name': name}:
-                    logger.info(f"  - {name} (ID unknown)")
-                case _:
-                    logger.info(f"  - {target}")
+        if logger.isEnabledFor(logging.INFO):
+            lines = []
+            for target in targets:
+                name = target.get('name') or str(target)
+                if (target_id := target.get('id')) is not None:
+                    lines.append(f"  - {name} (ID: {target_id})")
+                else:
+                    lines.append(f"  - {name} (ID unknown)")
+            logger.info("Found %d existing iSCSI targets:\n%s", len(targets), "\n".join(lines))
     else:
         logger.info("No existing iSCSI targets found")
     
@@ -302,18 +437,18 @@ def display_discovery_results(discovery_results: ISCSIDiscoveryResult, args: arg
     if storage_capacity := discovery_results.get('storage_capacity'):
         match storage_capacity:
             case {'error': error}:
-                logger.error(f"Storage capacity check failed: {error}")
+                logger.error("Storage capacity check failed: %s", error)
             case {'found': False}:
-                logger.error(f"ZFS pool '{args.zfs_pool}' not found")
+                logger.error("ZFS pool '%s' not found", args.zfs_pool)
             case {'sufficient': True}:
-                logger.info(f"Storage capacity is sufficient for test zvol")
+                logger.info("Storage capacity is sufficient for test zvol")
             case {'sufficient': False, 'free_bytes': free, 'required_bytes': required}:
-                logger.warning(f"Storage capacity may be insufficient for test zvol")
-                free_gb = free / (1024**3)
-                required_gb = required / (1024**3)
-                logger.warning(f"  Required: {required_gb:.1f} GB, Available: {free_gb:.1f} GB")
+                logger.warning("Storage capacity may be insufficient for test zvol")
+                free_gb = free * _INV_GIB
+                required_gb = required * _INV_GIB
+                logger.warning("  Required: %.1f GB, Available: %.1f GB", required_gb, free_gb)
             case _:
-                logger.warning(f"Storage capacity check returned unexpected format: {storage_capacity}")
+                logger.warning("Storage capacity check returned unexpected format: %s", storage_capacity)
 
 
 def display_processing_results(processing_results: ISCSIProcessResult, logger: logging.Logger) -> None:
@@ -326,22 +461,21 @@ def display_processing_results(processing_results: ISCSIProcessResult, logger: l
     """
     # Main processing results
     logger.info("Processing results:")
-    logger.info(f"- Zvol created: {processing_results.get('zvol_created', False)}")
-    logger.info(f"- Target created: {processing_results.get('target_created', False)}")
-    logger.info(f"- Extent created: {processing_results.get('extent_created', False)}")
-    logger.info(f"- Association created: {processing_results.get('association_created', False)}")
+    logger.info("- Zvol created: %s", processing_results.get('zvol_created', False))
+    logger.info("- Target created: %s", processing_results.get('target_created', False))
+    logger.info("- Extent created: %s", processing_results.get('extent_created', False))
+    logger.info("- Association created: %s", processing_results.get('association_created', False))
     
     # Display IDs if available
     if target_id := processing_results.get('target_id'):
-        logger.info(f"- Target ID: {target_id}")
+        logger.info("- Target ID: %s", target_id)
     if extent_id := processing_results.get('extent_id'):
-        logger.info(f"- Extent ID: {extent_id}")
+        logger.info("- Extent ID: %s", extent_id)
     
-    # Display error messages using pattern matching
-    for component in ['zvol', 'target', 'extent', 'association']:
-        error_key = f"{component}_error"
+    # Display error messages
+    for error_key, label in _ERROR_KEYS:
         if error := processing_results.get(error_key):
-            logger.error(f"{component.capitalize()} creation error: {error}")
+            logger.error("%s creation error: %s", label, error)
 
 
 def display_housekeeping_results(housekeeping_results: ISCSIHousekeepResult, logger: logging.Logger) -> None:
@@ -353,16 +487,14 @@ def display_housekeeping_results(housekeeping_results: ISCSIHousekeepResult, log
         logger: Logger instance
     """
     logger.info("Housekeeping results:")
-    logger.info(f"- Resources verified: {housekeeping_results.get('resources_verified', False)}")
-    logger.info(f"- Unused resources found: {housekeeping_results.get('unused_resources_found', 0)}")
-    logger.info(f"- Unused resources cleaned: {housekeeping_results.get('unused_resources_cleaned', 0)}")
+    logger.info("- Resources verified: %s", housekeeping_results.get('resources_verified', False))
+    logger.info("- Unused resources found: %s", housekeeping_results.get('unused_resources_found', 0))
+    logger.info("- Unused resources cleaned: %s", housekeeping_results.get('unused_resources_cleaned', 0))
     
     # Display warnings if any using pattern matching
     match housekeeping_results:
         case {'warnings': warnings} if warnings:
-            logger.warning(f"Housekeeping warnings:")
-            for warning in warnings:
-                logger.warning(f"  - {warning}")
+            logger.warning("Housekeeping warnings:\n%s", "\n".join(f"  - {warning}" for warning in warnings))
         case _:
             pass  # No warnings
 
@@ -379,21 +511,33 @@ def main() -> int:
     
     try:
         # Get API key if not provided
-        api_key: str
-        if args.api_key:
-            api_key = args.api_key
-        else:
-            api_key = getpass.getpass("Enter TrueNAS API key: ")
+        api_key, prompted = get_api_key(args, logger)
         
         # Configure ISCSIComponent
         iscsi_config = create_iscsi_config(args, api_key)
         
-        logger.info(f"Initializing ISCSIComponent for TrueNAS at {args.truenas_ip}")
+        logger.info("Initializing ISCSIComponent for TrueNAS at %s", args.truenas_ip)
         iscsi_component = ISCSIComponent(iscsi_config, logger)
         
         # Discovery phase
         logger.info("Starting discovery phase...")
-        discovery_results = cast(ISCSIDiscoveryResult, iscsi_component.discover())
+        cache_path = discovery_cache_path(args)
+        # Only a discovery-only run can use the cache; processing discovers again
+        # anyway, and connectivity must be checked against the live system
+        use_cache = args.discover_only and args.cache_ttl > 0
+        cached = None
+        if use_cache:
+            cached = load_cached_discovery(cache_path, args.cache_ttl)
+        
+        discovery_results: ISCSIDiscoveryResult
+        if cached is not None:
+            logger.info("Using cached discovery results from %s", cache_path)
+            discovery_results = cached
+        else:
+            discovery_results = cast(ISCSIDiscoveryResult, iscsi_component.discover())
+            update_keyring(args, api_key, prompted, discovery_results, logger)
+            if use_cache and discovery_results.get('connectivity', False):
+                store_discovery(cache_path, discovery_results)
         
         # Display discovery results
         display_discovery_results(discovery_results, args, logger)
@@ -415,6 +559,10 @@ def main() -> int:
             try:
                 processing_results = cast(ISCSIProcessResult, iscsi_component.process())
                 
+                # Cached discovery no longer reflects TrueNAS once resources were created
+                if not args.dry_run:
+                    cache_path.unlink(missing_ok=True)
+                
                 # Display processing results
                 display_processing_results(processing_results, logger)
                 
@@ -427,11 +575,11 @@ def main() -> int:
                     display_housekeeping_results(housekeeping_results, logger)
             
             except Exception as e:
-                logger.error(f"Error during testing: {str(e)}")
+                logger.error("Error during testing: %s", e)
                 return 1
     
     except Exception as e:
-        logger.error(f"Error during discovery: {str(e)}")
+        logger.error("Error during discovery: %s", e)
         import traceback
         logger.debug(traceback.format_exc())
         return 1
@@ -8,20 +8,26 @@ with its improved type annotations and features.
 
 import os
 import sys
-import json
 import logging
+import logging.handlers
 import tempfile
+import contextlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Union, cast
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from framework.py312_helpers import format_results
 
 # Import the Python 3.12 versions of components
 from framework.base_component_py312 import BaseComponent
 from framework.components.openshift_component_py312 import OpenShiftComponent, OpenShiftConfig
 from framework.components.s3_component_py312 import S3Component
 
-
 def setup_logging() -> logging.Logger:
     """
     Set up logging for the test script.
@@ -30,6 +36,10 @@ def setup_logging() -> logging.Logger:
         A configured logger
     """
     logger = logging.getLogger("openshift_component_test_py312")
+    
+    if logger.handlers:
+        return logger
+    
     logger.setLevel(logging.DEBUG)
     
     # Create console handler
@@ -42,8 +52,9 @@ def setup_logging() -> logging.Logger:
     )
     handler.setFormatter(formatter)
     
-    # Add handler to logger
-    logger.addHandler(handler)
+    # Buffer records and write them in batches; errors are written out immediately,
+    # and logging's exit hook flushes whatever is left
+    logger.addHandler(logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=handler))
     
     return logger
 
@@ -76,7 +87,7 @@ def setup_s3_component(logger: logging.Logger) -> Optional[S3Component]:
             'create_bucket': True
         }
         
-        logger.info(f"Creating S3 component with endpoint: {endpoint}")
+        logger.info("Creating S3 component with endpoint: %s", endpoint)
         s3_component = S3Component(s3_config, logger)
         
         # Run discovery to initialize the component
@@ -89,164 +100,136 @@ def setup_s3_component(logger: logging.Logger) -> Optional[S3Component]:
             logger.warning("Failed to connect to S3")
             return None
     except Exception as e:
-        logger.error(f"Error setting up S3 component: {str(e)}")
+        logger.error("Error setting up S3 component: %s", e)
         return None
 
 
-def test_openshift_component_discovery(config: OpenShiftConfig, logger: logging.Logger, 
-                                      s3_component: Optional[S3Component] = None) -> Dict[str, Any]:
+def test_openshift_component_discovery(openshift_component: OpenShiftComponent,
+                                      logger: logging.Logger) -> Dict[str, Any]:
     """
     Test the discovery phase of the OpenShiftComponent.
     
     Args:
-        config: OpenShift configuration
+        openshift_component: OpenShiftComponent shared by all phases
         logger: Logger instance
-        s3_component: Optional S3Component
         
     Returns:
         Discovery results
     """
     logger.info("Testing OpenShiftComponent discovery phase with Python 3.12 features")
     
-    # Create component
-    openshift_component = OpenShiftComponent(config, logger, s3_component)
-    
     # Run discovery phase
     discovery_results = openshift_component.discover()
     
     # Print results
-    logger.info(f"Discovery results: {json.dumps(discovery_results, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Discovery results: %s", format_results(discovery_results))
     
     # Verify available versions
     if discovery_results.get('available_versions'):
         versions = discovery_results['available_versions']
-        logger.info(f"✅ Found {len(versions)} available OpenShift versions: {', '.join(versions)}")
+        logger.info("✅ Found %d available OpenShift versions: %s", len(versions), ', '.join(versions))
     else:
         logger.warning("⚠️ No OpenShift versions found")
     
     # Check for OpenShift installer
     if discovery_results.get('installer_available'):
-        logger.info(f"✅ OpenShift installer found at: {discovery_results.get('installer_path')}")
+        logger.info("✅ OpenShift installer found at: %s", discovery_results.get('installer_path'))
     else:
         logger.warning("⚠️ OpenShift installer not found")
     
     # Check for pull secret
     if discovery_results.get('pull_secret_available'):
-        logger.info(f"✅ Pull secret found at: {discovery_results.get('pull_secret_path')}")
+        logger.info("✅ Pull secret found at: %s", discovery_results.get('pull_secret_path'))
     else:
         logger.warning("⚠️ Pull secret not found")
     
     # Check for SSH key
     if discovery_results.get('ssh_key_available'):
-        logger.info(f"✅ SSH key found at: {discovery_results.get('ssh_key_path')}")
+        logger.info("✅ SSH key found at: %s", discovery_results.get('ssh_key_path'))
     else:
         logger.warning("⚠️ SSH key not found")
     
     # Check temp directory
     if temp_dir := discovery_results.get('temp_dir'):
-        logger.info(f"✅ Temporary directory set up at: {temp_dir}")
+        logger.info("✅ Temporary directory set up at: %s", temp_dir)
     else:
         logger.warning("⚠️ Temporary directory not set up")
     
     return discovery_results
 
 
-def test_openshift_component_processing(config: OpenShiftConfig, logger: logging.Logger, 
-                                       discovery_results: Dict[str, Any],
-                                       s3_component: Optional[S3Component] = None) -> Dict[str, Any]:
+def test_openshift_component_processing(openshift_component: OpenShiftComponent,
+                                       logger: logging.Logger) -> Dict[str, Any]:
     """
     Test the processing phase of the OpenShiftComponent.
     
     Args:
-        config: OpenShift configuration
+        openshift_component: OpenShiftComponent that has completed discovery
         logger: Logger instance
-        discovery_results: Results from discovery phase
-        s3_component: Optional S3Component
         
     Returns:
         Processing results
     """
     logger.info("Testing OpenShiftComponent processing phase with Python 3.12 features")
     
-    # Create component
-    openshift_component = OpenShiftComponent(config, logger, s3_component)
-    
-    # Set component state from discovery
-    openshift_component.discovery_results = discovery_results
-    openshift_component.temp_dir = discovery_results.get('temp_dir')
-    openshift_component.phases_executed['discover'] = True
-    
     # Run processing phase
     processing_results = openshift_component.process()
     
     # Print results
-    logger.info(f"Processing results: {json.dumps(processing_results, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing results: %s", format_results(processing_results))
     
     # Check installer download
     if processing_results.get('installer_downloaded'):
-        logger.info(f"✅ OpenShift installer downloaded from {processing_results.get('installer_source')}")
+        logger.info("✅ OpenShift installer downloaded from %s", processing_results.get('installer_source'))
     else:
         logger.warning("⚠️ OpenShift installer not downloaded")
         if 'installer_error' in processing_results:
-            logger.warning(f"Error: {processing_results['installer_error']}")
+            logger.warning("Error: %s", processing_results['installer_error'])
     
     # Check ISO generation
     if processing_results.get('iso_generated'):
-        logger.info(f"✅ ISO generated at: {processing_results.get('iso_path')}")
+        logger.info("✅ ISO generated at: %s", processing_results.get('iso_path'))
     else:
         logger.warning("⚠️ ISO not generated")
     
     # Check S3 upload
     if upload_status := processing_results.get('upload_status'):
         if upload_status == 'success':
-            logger.info(f"✅ ISO uploaded to S3: {processing_results.get('s3_iso_path')}")
+            logger.info("✅ ISO uploaded to S3: %s", processing_results.get('s3_iso_path'))
         else:
-            logger.warning(f"⚠️ ISO upload {upload_status}")
+            logger.warning("⚠️ ISO upload %s", upload_status)
             if 'upload_error' in processing_results:
-                logger.warning(f"Error: {processing_results['upload_error']}")
+                logger.warning("Error: %s", processing_results['upload_error'])
     
     return processing_results
 
 
-def test_openshift_component_housekeeping(config: OpenShiftConfig, logger: logging.Logger, 
-                                         discovery_results: Dict[str, Any],
-                                         processing_results: Dict[str, Any],
-                                         s3_component: Optional[S3Component] = None) -> Dict[str, Any]:
+def test_openshift_component_housekeeping(openshift_component: OpenShiftComponent,
+                                         logger: logging.Logger) -> Dict[str, Any]:
     """
     Test the housekeeping phase of the OpenShiftComponent.
     
     Args:
-        config: OpenShift configuration
+        openshift_component: OpenShiftComponent that has completed processing
         logger: Logger instance
-        discovery_results: Results from discovery phase
-        processing_results: Results from processing phase
-        s3_component: Optional S3Component
         
     Returns:
         Housekeeping results
     """
     logger.info("Testing OpenShiftComponent housekeeping phase with Python 3.12 features")
     
-    # Create component
-    openshift_component = OpenShiftComponent(config, logger, s3_component)
-    
-    # Set component state
-    openshift_component.discovery_results = discovery_results
-    openshift_component.processing_results = processing_results
-    openshift_component.temp_dir = discovery_results.get('temp_dir')
-    openshift_component.iso_path = processing_results.get('iso_path')
-    openshift_component.phases_executed['discover'] = True
-    openshift_component.phases_executed['process'] = True
-    
     # Run housekeeping phase
     housekeeping_results = openshift_component.housekeep()
     
     # Print results
-    logger.info(f"Housekeeping results: {json.dumps(housekeeping_results, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Housekeeping results: %s", format_results(housekeeping_results))
     
     # Check ISO verification
     if housekeeping_results.get('iso_verified'):
-        logger.info(f"✅ ISO verified with hash: {housekeeping_results.get('iso_hash')}")
+        logger.info("✅ ISO verified with hash: %s", housekeeping_results.get('iso_hash'))
     else:
         logger.warning("⚠️ ISO not verified")
     
@@ -265,6 +248,40 @@ def test_openshift_component_housekeeping(config: OpenShiftConfig, logger: loggi
     return housekeeping_results
 
 
+def _dry_run_download_installer(self: OpenShiftComponent) -> None:
+    """Pretend the installer was downloaded"""
+    self.processing_results['installer_downloaded'] = True
+
+
+def _dry_run_create_install_configs(self: OpenShiftComponent) -> None:
+    """Pretend the install configs were created"""
+    self.processing_results['configs_created'] = True
+
+
+def _dry_run_generate_iso(self: OpenShiftComponent) -> None:
+    """Write a dummy ISO in place of a generated one"""
+    iso_path = Path(self.temp_dir or '', "agent.x86_64.iso")
+    if not iso_path.exists():
+        iso_path.write_bytes(b'DUMMY ISO CONTENT')
+    self.iso_path = str(iso_path)
+    self.processing_results['iso_generated'] = True
+    self.processing_results['iso_path'] = self.iso_path
+
+
+def _dry_run_verify_iso(self: OpenShiftComponent) -> None:
+    """Record a placeholder hash; the dummy ISO is not worth hashing"""
+    self.housekeeping_results['iso_hash'] = 'DRYRUN'
+    self.housekeeping_results['iso_verified'] = True
+
+
+def install_dry_run_placeholders() -> None:
+    """Replace the expensive OpenShiftComponent steps with dry-run placeholders"""
+    OpenShiftComponent._download_installer = _dry_run_download_installer
+    OpenShiftComponent._create_install_configs = _dry_run_create_install_configs
+    OpenShiftComponent._generate_iso = _dry_run_generate_iso
+    OpenShiftComponent._verify_iso = _dry_run_verify_iso
+
+
 def run_all_tests(dry_run: bool = True) -> None:
     """
     Run all OpenShiftComponent tests.
@@ -275,50 +292,49 @@ def run_all_tests(dry_run: bool = True) -> None:
     logger = setup_logging()
     logger.info("Starting Python 3.12 OpenShiftComponent tests")
     
-    # Set up S3 component if possible
-    s3_component = setup_s3_component(logger)
-    
-    # Create test directory
-    output_dir = tempfile.mkdtemp(prefix="openshift-py312-test-")
-    logger.info(f"Created test directory: {output_dir}")
-    
-    # Create test configuration
-    config: OpenShiftConfig = {
-        'openshift_version': os.environ.get('OPENSHIFT_VERSION', 'stable'),
-        'domain': 'test.example.com',
-        'rendezvous_ip': '192.168.1.1',
-        'output_dir': output_dir,
-        'skip_upload': not s3_component,  # Skip upload if no S3 component
-        'cleanup_temp_files': False,  # Keep files for inspection in test
-        'hostname': 'test-host',
-        'server_id': f"test-{os.getpid()}"
-    }
-    
-    if dry_run:
-        logger.info("Running in DRY RUN mode - skipping actual ISO generation")
-        # Override methods to use placeholders for dry run
-        OpenShiftComponent._download_installer = lambda self: setattr(self.processing_results, 'installer_downloaded', True)
-        OpenShiftComponent._create_install_configs = lambda self: setattr(self.processing_results, 'configs_created', True)
-        OpenShiftComponent._generate_iso = lambda self: (
-            setattr(self.processing_results, 'iso_generated', True),
-            setattr(self.processing_results, 'iso_path', os.path.join(self.temp_dir or '', "agent.x86_64.iso")),
-            setattr(self, 'iso_path', os.path.join(self.temp_dir or '', "agent.x86_64.iso")),
-            # Create dummy ISO file for testing
-            open(os.path.join(self.temp_dir or '', "agent.x86_64.iso"), 'wb').write(b'DUMMY ISO CONTENT')
-        )
+    # Create test directory, removed on exit unless KEEP_TEST_FILES is set
+    keep_files = os.environ.get('KEEP_TEST_FILES') == 'true'
+    if keep_files:
+        test_dir = contextlib.nullcontext(tempfile.mkdtemp(prefix="openshift-py312-test-"))
+    else:
+        test_dir = tempfile.TemporaryDirectory(prefix="openshift-py312-test-")
     
-    try:
-        # Run tests in sequence
-        discovery_results = test_openshift_component_discovery(config, logger, s3_component)
-        processing_results = test_openshift_component_processing(config, logger, discovery_results, s3_component)
-        housekeeping_results = test_openshift_component_housekeeping(config, logger, discovery_results, processing_results, s3_component)
-    
-    finally:
-        # Clean up test directory if needed
-        if os.path.exists(output_dir) and os.environ.get('KEEP_TEST_FILES') != 'true':
-            import shutil
-            shutil.rmtree(output_dir, ignore_errors=True)
-            logger.info(f"Cleaned up test directory: {output_dir}")
+    with test_dir as output_dir:
+        logger.info("Created test directory: %s", output_dir)
+        
+        # Create test configuration
+        config: OpenShiftConfig = {
+            'openshift_version': os.environ.get('OPENSHIFT_VERSION', 'stable'),
+            'domain': 'test.example.com',
+            'rendezvous_ip': '192.168.1.1',
+            'output_dir': output_dir,
+            'skip_upload': True,  # Updated once the S3 component is set up
+            'cleanup_temp_files': False,  # Keep files for inspection in test
+            'hostname': 'test-host',
+            'server_id': f"test-{os.getpid()}"
+        }
+        
+        if dry_run:
+            logger.info("Running in DRY RUN mode - skipping actual ISO generation")
+            install_dry_run_placeholders()
+        
+        # One component carries its state through all three phases
+        openshift_component = OpenShiftComponent(config, logger)
+        
+        # Set up S3 while discovery runs; discovery only performs local checks
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            s3_future = executor.submit(setup_s3_component, logger)
+            discovery_future = executor.submit(test_openshift_component_discovery, openshift_component, logger)
+        s3_component, discovery_results = s3_future.result(), discovery_future.result()
+        openshift_component.s3_component = s3_component
+        openshift_component.config['skip_upload'] = not s3_component  # Skip upload if no S3 component
+        
+        # Run remaining tests in sequence
+        processing_results = test_openshift_component_processing(openshift_component, logger)
+        housekeeping_results = test_openshift_component_housekeeping(openshift_component, logger)
+    
+    if not keep_files:
+        logger.info("Cleaned up test directory: %s", output_dir)
     
     logger.info("Python 3.12 OpenShiftComponent tests completed")
 
@@ -9,14 +9,21 @@ with its improved type annotations and features.
 import os
 import sys
 import json
+import re
 import logging
 import requests
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Union, cast
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from framework.py312_helpers import format_results
 
 # Import the Python 3.12 versions of components
 from framework.base_component_py312 import BaseComponent
@@ -26,6 +33,12 @@ from framework.components.r630_component_py312 import (
 )
 
 
+# Console handler shared by every logger setup in this script
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setLevel(logging.DEBUG)
+_LOG_HANDLER.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+
 def setup_logging() -> logging.Logger:
     """
     Set up logging for the test script.
@@ -34,24 +47,15 @@ def setup_logging() -> logging.Logger:
         A configured logger
     """
     logger = logging.getLogger("r630_component_test_py312")
-    logger.setLevel(logging.DEBUG)
-    
-    # Create console handler
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    
-    # Add handler to logger
-    logger.addHandler(handler)
+    if _LOG_HANDLER not in logger.handlers:
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(_LOG_HANDLER)
     
     return logger
 
 
+@functools.lru_cache(maxsize=1)
 def setup_mocked_responses() -> Dict[str, Any]:
     """
     Set up mock responses for iDRAC API calls.
@@ -213,11 +217,20 @@ def setup_mocked_responses() -> Dict[str, Any]:
 class MockResponse:
     """Mock requests.Response for testing"""
     
+    __slots__ = ('json_data', 'status_code', 'headers', '_text')
+    
     def __init__(self, json_data, status_code=200, headers=None, text=None):
         self.json_data = json_data
         self.status_code = status_code
         self.headers = headers or {}
-        self.text = text if text is not None else json.dumps(json_data)
+        self._text = text
+    
+    @property
+    def text(self):
+        # Serialised on first access only; most callers never read it
+        if self._text is None:
+            self._text = json.dumps(self.json_data)
+        return self._text
     
     def json(self):
         return self.json_data
@@ -227,30 +240,30 @@ class MockResponse:
             raise requests.exceptions.HTTPError(f"HTTP Error: {self.status_code}")
 
 
+@functools.lru_cache(maxsize=None)
+def mock_response(key: str) -> MockResponse:
+    """Build the MockResponse for a mocked endpoint once and reuse it"""
+    return MockResponse(setup_mocked_responses()[key])
+
+
+# Mocked iDRAC endpoints; each named group is the setup_mocked_responses() key it serves
+_MOCK_URL_RE = re.compile(
+    r'redfish/v1/(?:'
+    r'Systems/System\.Embedded\.1(?:'
+    r'(?P<system_info>$)'
+    r'|.*?(?P<bios_data>Bios)'
+    r'|.*?(?P<boot_options_data>BootOptions)'
+    r'|.*?EthernetInterfaces(?:(?P<network_interfaces_data>$)|.*?(?P<nic1_data>NIC\.1)|.*?(?P<nic2_data>NIC\.2))'
+    r')'
+    r'|Managers/iDRAC\.Embedded\.1(?:(?P<idrac_info>$)|.*?(?P<job_data>Jobs))'
+    r')'
+)
+
+
 def mocked_requests_get(url, *args, **kwargs):
     """Mock function for requests.get"""
-    mock_data = setup_mocked_responses()
-    
-    # Base URL pattern matching
-    if 'redfish/v1/Systems/System.Embedded.1' in url:
-        if url.endswith('System.Embedded.1'):
-            return MockResponse(mock_data['system_info'])
-        elif 'Bios' in url:
-            return MockResponse(mock_data['bios_data'])
-        elif 'BootOptions' in url:
-            return MockResponse(mock_data['boot_options_data'])
-        elif 'EthernetInterfaces' in url:
-            if url.endswith('EthernetInterfaces'):
-                return MockResponse(mock_data['network_interfaces_data'])
-            elif 'NIC.1' in url:
-                return MockResponse(mock_data['nic1_data'])
-            elif 'NIC.2' in url:
-                return MockResponse(mock_data['nic2_data'])
-    elif 'redfish/v1/Managers/iDRAC.Embedded.1' in url:
-        if url.endswith('iDRAC.Embedded.1'):
-            return MockResponse(mock_data['idrac_info'])
-        elif 'Jobs' in url:
-            return MockResponse(mock_data['job_data'])
+    if match := _MOCK_URL_RE.search(url):
+        return mock_response(match.lastgroup)
     
     # Default fallback
     return MockResponse({}, 404)
@@ -258,10 +271,8 @@ def mocked_requests_get(url, *args, **kwargs):
 
 def mocked_requests_patch(url, *args, **kwargs):
     """Mock function for requests.patch"""
-    mock_data = setup_mocked_responses()
-    
     headers = {'Location': '/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789'}
-    return MockResponse(mock_data['patch_response'], 202, headers)
+    return MockResponse(setup_mocked_responses()['patch_response'], 202, headers)
 
 
 def mocked_requests_post(url, *args, **kwargs):
@@ -299,42 +310,37 @@ def test_r630_component_with_mocks():
         }
     }
     
-    # Create patches for requests module
-    get_patch = patch('requests.Session.get', side_effect=mocked_requests_get)
-    patch_patch = patch('requests.Session.patch', side_effect=mocked_requests_patch)
-    post_patch = patch('requests.Session.post', side_effect=mocked_requests_post)
-    
-    # Start patches
-    get_patch.start()
-    patch_patch.start()
-    post_patch.start()
-    
-    try:
+    # Patch the requests module for the duration of the test
+    with (
+        patch('requests.Session.get', side_effect=mocked_requests_get),
+        patch('requests.Session.patch', side_effect=mocked_requests_patch),
+        patch('requests.Session.post', side_effect=mocked_requests_post),
+    ):
         # Create R630Component
         r630_component = R630Component(config, logger)
         
         # Run discovery phase
         logger.info("Running discovery phase...")
         discovery_results = r630_component.discover()
-        logger.info(f"Discovery completed: connectivity={discovery_results.get('connectivity')}")
+        logger.info("Discovery completed: connectivity=%s", discovery_results.get('connectivity'))
         
         # Check discovery results
         if discovery_results.get('connectivity', False):
             logger.info("✅ Successfully connected to iDRAC")
             
             if server_info := discovery_results.get('server_info'):
-                logger.info(f"✅ Server model: {server_info.get('model')}")
-                logger.info(f"✅ Serial number: {server_info.get('serial_number')}")
-                logger.info(f"✅ Power state: {server_info.get('power_state')}")
+                logger.info("✅ Server model: %s", server_info.get('model'))
+                logger.info("✅ Serial number: %s", server_info.get('serial_number'))
+                logger.info("✅ Power state: %s", server_info.get('power_state'))
             
             if boot_mode := discovery_results.get('boot_mode'):
-                logger.info(f"✅ Current boot mode: {boot_mode}")
+                logger.info("✅ Current boot mode: %s", boot_mode)
             
             if boot_order := discovery_results.get('current_boot_order'):
-                logger.info(f"✅ Current boot order: {boot_order}")
+                logger.info("✅ Current boot order: %s", boot_order)
             
             if bios_settings := discovery_results.get('bios_settings'):
-                logger.info(f"✅ Retrieved {len(bios_settings)} BIOS settings")
+                logger.info("✅ Retrieved %s BIOS settings", len(bios_settings))
         else:
             logger.error("❌ Failed to connect to iDRAC")
             return
@@ -358,7 +364,7 @@ def test_r630_component_with_mocks():
             logger.info("✅ Triggered server reboot")
         
         if job_id := processing_results.get('job_id'):
-            logger.info(f"✅ Job ID for configuration changes: {job_id}")
+            logger.info("✅ Job ID for configuration changes: %s", job_id)
         
         # Run housekeeping phase
         logger.info("Running housekeeping phase...")
@@ -375,25 +381,21 @@ def test_r630_component_with_mocks():
         else:
             logger.warning("⚠️ Configuration changes not verified")
             for warning in housekeeping_results.get('warnings', []):
-                logger.warning(f"  - {warning}")
+                logger.warning("  - %s", warning)
         
         # Demonstrate configuration details
+        final_state = housekeeping_results.get('final_state') or {}
         config_details = {
             'server_id': r630_component.config.get('server_id'),
             'idrac_ip': r630_component.config.get('idrac_ip'),
-            'boot_order': housekeeping_results.get('final_state', {}).get('boot_order', []),
-            'bios_settings': housekeeping_results.get('final_state', {}).get('bios_settings', {})
+            'boot_order': final_state.get('boot_order', []),
+            'bios_settings': final_state.get('bios_settings', {})
         }
         
-        logger.info(f"R630 Configuration Details:\n{json.dumps(config_details, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("R630 Configuration Details:\n%s", format_results(config_details))
         
         logger.info("R630 component test completed successfully")
-        
-    finally:
-        # Stop patches
-        get_patch.stop()
-        patch_patch.stop()
-        post_patch.stop()
 
 
 def test_r630_utils():
@@ -415,17 +417,17 @@ def test_r630_utils():
     # Test the merge operation
     merged_config = default_config | custom_config
     
-    logger.info(f"Default config has {len(default_config)} keys")
-    logger.info(f"Custom config has {len(custom_config)} keys")
-    logger.info(f"Merged config has {len(merged_config)} keys")
+    logger.info("Default config has %s keys", len(default_config))
+    logger.info("Custom config has %s keys", len(custom_config))
+    logger.info("Merged config has %s keys", len(merged_config))
     
     # Verify merge retained all default keys
-    all_default_keys_preserved = all(key in merged_config for key in default_config.keys())
-    logger.info(f"All default keys preserved: {all_default_keys_preserved}")
+    all_default_keys_preserved = default_config.keys() <= merged_config.keys()
+    logger.info("All default keys preserved: %s", all_default_keys_preserved)
     
     # Verify custom values override defaults
-    custom_values_applied = all(merged_config[key] == custom_config[key] for key in custom_config.keys())
-    logger.info(f"Custom values properly applied: {custom_values_applied}")
+    custom_values_applied = all(merged_config[key] == value for key, value in custom_config.items())
+    logger.info("Custom values properly applied: %s", custom_values_applied)
     
     logger.info("Utility method tests completed")
 
@@ -435,9 +437,12 @@ def run_all_tests():
     logger = setup_logging()
     logger.info("Starting R630 component Python 3.12 tests")
     
-    # Run each test
-    test_r630_component_with_mocks()
-    test_r630_utils()
+    # The tests are independent, and test_r630_utils makes no requests, so the
+    # global requests patches in test_r630_component_with_mocks do not affect it
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(test) for test in (test_r630_component_with_mocks, test_r630_utils)]
+    for future in futures:
+        future.result()
     
     logger.info("All R630 component tests completed successfully")
 
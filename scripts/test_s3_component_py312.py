@@ -8,19 +8,29 @@ with its improved type annotations and features.
 
 import os
 import sys
-import json
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from framework.py312_helpers import format_results
 
 # Import the Python 3.12 versions of components
 from framework.base_component_py312 import BaseComponent
 from framework.components.s3_component_py312 import S3Component, S3Config
 
 
+# Console handler shared by every logger setup in this script
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setLevel(logging.DEBUG)
+_LOG_HANDLER.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+
 def setup_logging() -> logging.Logger:
     """
     Set up logging for the test script.
@@ -29,30 +39,20 @@ def setup_logging() -> logging.Logger:
         A configured logger
     """
     logger = logging.getLogger("s3_component_test_py312")
-    logger.setLevel(logging.DEBUG)
-    
-    # Create console handler
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
     
-    # Add handler to logger
-    logger.addHandler(handler)
+    if _LOG_HANDLER not in logger.handlers:
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(_LOG_HANDLER)
     
     return logger
 
 
-def test_s3_component_discovery(config: S3Config, logger: logging.Logger) -> Dict[str, Any]:
+def test_s3_component_discovery(s3_component: S3Component, logger: logging.Logger) -> Dict[str, Any]:
     """
     Test the discovery phase of the S3Component.
     
     Args:
-        config: S3 configuration
+        s3_component: S3Component shared by all tests
         logger: Logger instance
         
     Returns:
@@ -60,39 +60,39 @@ def test_s3_component_discovery(config: S3Config, logger: logging.Logger) -> Dic
     """
     logger.info("Testing S3Component discovery phase with Python 3.12 features")
     
-    # Create component
-    s3_component = S3Component(config, logger)
-    
     # Run discovery phase
     discovery_results = s3_component.discover()
     
     # Print results
-    logger.info(f"Discovery results: {json.dumps(discovery_results, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Discovery results: %s", format_results(discovery_results))
     
     # Verify connectivity
     if discovery_results.get('connectivity', False):
         logger.info("✅ Successfully connected to S3 endpoint")
-        logger.info(f"Found {discovery_results.get('bucket_count', 0)} buckets")
+        logger.info("Found %s buckets", discovery_results.get('bucket_count', 0))
         
         # Check buckets
+        buckets = discovery_results.get('buckets') or {}
         for bucket_type in ['private', 'public']:
-            if discovery_results.get('buckets', {}).get(bucket_type, {}).get('exists', False):
-                logger.info(f"✅ {bucket_type.capitalize()} bucket exists")
-                logger.info(f"Contains {discovery_results.get('buckets', {}).get(bucket_type, {}).get('objects_count', 0)} objects")
+            bucket = buckets.get(bucket_type) or {}
+            if bucket.get('exists', False):
+                logger.info("✅ %s bucket exists", bucket_type.capitalize())
+                logger.info("Contains %s objects", bucket.get('objects_count', 0))
             else:
-                logger.warning(f"⚠️ {bucket_type.capitalize()} bucket does not exist")
+                logger.warning("⚠️ %s bucket does not exist", bucket_type.capitalize())
     else:
         logger.error("❌ Failed to connect to S3 endpoint")
     
     return discovery_results
 
 
-def test_s3_component_processing(config: S3Config, logger: logging.Logger, discovery_results: Dict[str, Any]) -> Dict[str, Any]:
+def test_s3_component_processing(s3_component: S3Component, logger: logging.Logger, discovery_results: Dict[str, Any]) -> Dict[str, Any]:
     """
     Test the processing phase of the S3Component.
     
     Args:
-        config: S3 configuration
+        s3_component: S3Component that has completed discovery
         logger: Logger instance
         discovery_results: Results from discovery phase
         
@@ -106,36 +106,32 @@ def test_s3_component_processing(config: S3Config, logger: logging.Logger, disco
         logger.error("❌ Skipping processing due to failed discovery")
         return {'error': 'Skipped due to failed discovery'}
     
-    # Create component with recovered state
-    s3_component = S3Component(config, logger)
-    s3_component.discovery_results = discovery_results
-    s3_component.phases_executed['discover'] = True
-    
     # Run processing phase
     processing_results = s3_component.process()
     
     # Print results
-    logger.info(f"Processing results: {json.dumps(processing_results, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing results: %s", format_results(processing_results))
     
     # Check actions
     if processing_results.get('actions'):
-        logger.info(f"Performed {len(processing_results.get('actions', []))} actions")
+        logger.info("Performed %s actions", len(processing_results.get('actions', [])))
         for action in processing_results.get('actions', []):
-            logger.info(f"  - {action}")
+            logger.info("  - %s", action)
     else:
         logger.warning("⚠️ No actions performed during processing")
     
     return processing_results
 
 
-def test_s3_component_housekeeping(config: S3Config, logger: logging.Logger, 
+def test_s3_component_housekeeping(s3_component: S3Component, logger: logging.Logger, 
                                    discovery_results: Dict[str, Any], 
                                    processing_results: Dict[str, Any]) -> Dict[str, Any]:
     """
     Test the housekeeping phase of the S3Component.
     
     Args:
-        config: S3 configuration
+        s3_component: S3Component that has completed processing
         logger: Logger instance
         discovery_results: Results from discovery phase
         processing_results: Results from processing phase
@@ -150,54 +146,43 @@ def test_s3_component_housekeeping(config: S3Config, logger: logging.Logger,
         logger.error("❌ Skipping housekeeping due to failed previous phases")
         return {'error': 'Skipped due to failed previous phases'}
     
-    # Create component with recovered state
-    s3_component = S3Component(config, logger)
-    s3_component.discovery_results = discovery_results
-    s3_component.processing_results = processing_results
-    s3_component.phases_executed['discover'] = True
-    s3_component.phases_executed['process'] = True
-    
     # Run housekeeping phase
     housekeeping_results = s3_component.housekeep()
     
     # Print results
-    logger.info(f"Housekeeping results: {json.dumps(housekeeping_results, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Housekeeping results: %s", format_results(housekeeping_results))
     
     # Check verifications
     for verification, status in housekeeping_results.get('verification', {}).items():
         if status:
-            logger.info(f"✅ Verified {verification}")
+            logger.info("✅ Verified %s", verification)
         else:
-            logger.warning(f"⚠️ Failed to verify {verification}")
+            logger.warning("⚠️ Failed to verify %s", verification)
     
     # Check warnings
     if housekeeping_results.get('warnings'):
-        logger.warning(f"Found {len(housekeeping_results.get('warnings', []))} warnings during housekeeping")
+        logger.warning("Found %s warnings during housekeeping", len(housekeeping_results.get('warnings', [])))
         for warning in housekeeping_results.get('warnings', []):
-            logger.warning(f"  - {warning}")
+            logger.warning("  - %s", warning)
     
     return housekeeping_results
 
 
-def test_s3_component_artifact_handling(config: S3Config, logger: logging.Logger) -> None:
+def test_s3_component_artifact_handling(s3_component: S3Component, logger: logging.Logger) -> None:
     """
     Test artifact handling with the S3Component.
     
     Args:
-        config: S3 configuration
+        s3_component: S3Component that has completed processing, so buckets exist
         logger: Logger instance
     """
     logger.info("Testing S3Component artifact handling with Python 3.12 features")
     
-    # Create component
-    s3_component = S3Component(config, logger)
-    
-    # First discover and process to ensure buckets exist
-    s3_component.discover()
-    s3_component.process()
-    
-    # Create a test file
-    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+    # Create a test file, in memory-backed /dev/shm where available; the component
+    # only uploads file artifacts given as a path, so a BytesIO would not exercise that path
+    temp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    with tempfile.NamedTemporaryFile(suffix='.txt', dir=temp_dir, delete=False) as f:
         temp_file = f.name
         f.write(b"This is a test artifact file for Python 3.12 S3Component")
     
@@ -208,7 +193,7 @@ def test_s3_component_artifact_handling(config: S3Config, logger: logging.Logger
             "This is a test string artifact from Python 3.12",
             {"description": "Test string artifact", "format": "text/plain"}
         )
-        logger.info(f"Added string artifact with ID: {string_id}")
+        logger.info("Added string artifact with ID: %s", string_id)
         
         # Add file artifact
         file_id = s3_component.add_artifact(
@@ -216,7 +201,7 @@ def test_s3_component_artifact_handling(config: S3Config, logger: logging.Logger
             temp_file,
             {"description": "Test file artifact", "format": "text/plain"}
         )
-        logger.info(f"Added file artifact with ID: {file_id}")
+        logger.info("Added file artifact with ID: %s", file_id)
         
         # Add JSON artifact
         json_id = s3_component.add_artifact(
@@ -224,11 +209,11 @@ def test_s3_component_artifact_handling(config: S3Config, logger: logging.Logger
             {"test": True, "python_version": "3.12", "features": ["improved typing", "dict merging"]},
             {"description": "Test JSON artifact", "format": "application/json"}
         )
-        logger.info(f"Added JSON artifact with ID: {json_id}")
+        logger.info("Added JSON artifact with ID: %s", json_id)
         
         # Store artifacts
         s3_component._store_artifacts()
-        logger.info(f"Stored {len(s3_component.artifacts)} artifacts")
+        logger.info("Stored %s artifacts", len(s3_component.artifacts))
         
     finally:
         # Clean up
@@ -236,33 +221,29 @@ def test_s3_component_artifact_handling(config: S3Config, logger: logging.Logger
             os.unlink(temp_file)
 
 
-def test_iso_operations(config: S3Config, logger: logging.Logger) -> None:
+def test_iso_operations(s3_component: S3Component, logger: logging.Logger) -> None:
     """
     Test ISO operations with the S3Component.
     
     Note: This is a simulation only as we don't have actual ISO files.
     
     Args:
-        config: S3 configuration
+        s3_component: S3Component that has completed discovery
         logger: Logger instance
     """
     logger.info("Testing S3Component ISO operations simulation with Python 3.12 features")
     
-    # Create component and ensure basics work
-    s3_component = S3Component(config, logger)
-    s3_component.discover()
-    
     # List ISOs (if any)
     try:
         isos = s3_component.list_isos()
-        logger.info(f"Found {len(isos)} ISOs in S3 storage")
+        logger.info("Found %s ISOs in S3 storage", len(isos))
         
         # Show first few
         for iso in isos[:3]:
-            logger.info(f"ISO: {iso.get('key')} - Size: {iso.get('size')}")
+            logger.info("ISO: %s - Size: %s", iso.get('key'), iso.get('size'))
             
     except Exception as e:
-        logger.error(f"Error listing ISOs: {str(e)}")
+        logger.error("Error listing ISOs: %s", e)
 
 
 def run_all_tests() -> None:
@@ -279,14 +260,24 @@ def run_all_tests() -> None:
         'create_metadata_index': True
     }
     
+    # One component carries its state through all tests
+    s3_component = S3Component(config, logger)
+    
     # Run tests in sequence
-    discovery_results = test_s3_component_discovery(config, logger)
+    discovery_results = test_s3_component_discovery(s3_component, logger)
     if discovery_results.get('connectivity', False):
-        processing_results = test_s3_component_processing(config, logger, discovery_results)
+        processing_results = test_s3_component_processing(s3_component, logger, discovery_results)
         if 'error' not in processing_results:
-            test_s3_component_housekeeping(config, logger, discovery_results, processing_results)
-            test_s3_component_artifact_handling(config, logger)
-            test_iso_operations(config, logger)
+            test_s3_component_housekeeping(s3_component, logger, discovery_results, processing_results)
+            
+            # Storing artifacts and listing ISOs are independent S3 round trips
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(test_s3_component_artifact_handling, s3_component, logger),
+                    executor.submit(test_iso_operations, s3_component, logger)
+                ]
+            for future in futures:
+                future.result()
     
     logger.info("Python 3.12 S3Component tests completed")
 
@@ -4,6 +4,8 @@
 import argparse
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 def test_connection(host, port=None, use_https=True, api_key=None, username=None, password=None):
     """Test connection to TrueNAS Scale API"""
@@ -53,54 +55,93 @@ def test_connection(host, port=None, use_https=True, api_key=None, username=None
     # Try different combinations
     ports_to_try = [port] if port else [None, 80, 443, 444, 8080]
     
-    for current_port in ports_to_try:
-        for use_ssl in [use_https, not use_https]:
-            protocol = "https" if use_ssl else "http"
-            
-            if current_port:
-                current_base = f"{protocol}://{host}:{current_port}/api"
-            else:
-                current_base = f"{protocol}://{host}/api"
-            
-            print(f"\nTrying {current_base}...")
-            
-            for path in api_paths:
-                url = current_base + path
-                try:
-                    print(f"  Testing {url}...")
-                    response = requests.get(
-                        url, 
-                        headers=headers, 
-                        auth=auth, 
-                        verify=False,  # Skip SSL verification
-                        timeout=5
-                    )
-                    
-                    # Handle different status codes
-                    if response.status_code == 200:
-                        print(f"  ✅ SUCCESS! Got 200 OK from {url}")
-                        print(f"  Response: {response.text[:100]}...")
-                        return {
-                            "success": True,
-                            "protocol": protocol,
-                            "host": host,
-                            "port": current_port,
-                            "path": path,
-                            "url": url
-                        }
-                    elif response.status_code == 401:
-                        print(f"  ⚠️ Authentication needed for {url}")
-                    elif response.status_code == 403:
-                        print(f"  ⚠️ Authentication failed for {url}")
-                    else:
-                        print(f"  ❌ Got status {response.status_code} from {url}")
-                
-                except requests.exceptions.ConnectionError as e:
-                    print(f"  ❌ Connection error: {e.__class__.__name__}")
-                except requests.exceptions.Timeout:
-                    print(f"  ❌ Timeout connecting to {url}")
-                except requests.exceptions.RequestException as e:
-                    print(f"  ❌ Request error: {e}")
+    # Probes to the same host reuse one pooled connection per scheme/port
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    # Every (port, scheme, path) combination is an independent probe; the URLs
+    # are built once per (port, scheme) base here rather than inside each probe
+    bases = [
+        (current_port, protocol,
+         f"{protocol}://{host}:{current_port}/api" if current_port else f"{protocol}://{host}/api")
+        for current_port in ports_to_try
+        for protocol in (["https", "http"] if use_https else ["http", "https"])
+    ]
+    candidates = [
+        (current_port, protocol, path, current_base + path)
+        for current_port, protocol, current_base in bases
+        for path in api_paths
+    ]
+    
+    def probe(candidate, timeout=5, preflight=False):
+        """Issue a single probe, returning the response or the raised error"""
+        url = candidate[3]
+        try:
+            if preflight:
+                # A HEAD rules out 401/403/404 endpoints without transferring a body;
+                # any other answer, including servers that do not support HEAD, gets
+                # a full GET
+                response = session.head(url, headers=headers, auth=auth, allow_redirects=True, timeout=timeout, verify=False)
+                if response.status_code in (401, 403, 404):
+                    return response
+            return session.get(url, headers=headers, auth=auth, timeout=timeout, verify=False)
+        except requests.exceptions.RequestException as e:
+            return e
+    
+    def report(candidate, response):
+        """Print the outcome of a probe, returning the connection details on 200"""
+        current_port, protocol, path, url = candidate
+        
+        if isinstance(response, requests.exceptions.ConnectionError):
+            print(f"  ❌ Connection error for {url}: {response.__class__.__name__}")
+        elif isinstance(response, requests.exceptions.Timeout):
+            print(f"  ❌ Timeout connecting to {url}")
+        elif isinstance(response, requests.exceptions.RequestException):
+            print(f"  ❌ Request error for {url}: {response}")
+        
+        # Handle different status codes
+        elif response.status_code == 200:
+            print(f"  ✅ SUCCESS! Got 200 OK from {url}")
+            print(f"  Response: {response.text[:100]}...")
+            return {
+                "success": True,
+                "protocol": protocol,
+                "host": host,
+                "port": current_port,
+                "path": path,
+                "url": url
+            }
+        elif response.status_code == 401:
+            print(f"  ⚠️ Authentication needed for {url}")
+        elif response.status_code == 403:
+            print(f"  ⚠️ Authentication failed for {url}")
+        else:
+            print(f"  ❌ Got status {response.status_code} from {url}")
+        return None
+    
+    executor = ThreadPoolExecutor(max_workers=16)
+    try:
+        # Most deployments answer on the requested scheme/port with the v2.0 API,
+        # so try that alone first and only sweep the full matrix if it fails
+        primary = candidates[0]
+        print("\nProbing the default API endpoint...")
+        if result := report(primary, probe(primary, timeout=10)):
+            return result
+        
+        print(f"\nProbing {len(candidates) - 1} alternative API endpoints...")
+        futures = [executor.submit(probe, candidate, preflight=True) for candidate in candidates[1:]]
+        # The probes run concurrently, but results are taken in priority order so
+        # the highest-priority endpoint that answers wins, as with a serial sweep
+        for candidate, future in zip(candidates[1:], futures):
+            if result := report(candidate, future.result()):
+                return result
+    finally:
+        # Drop probes that have not started once an endpoint answered, and let the
+        # running ones finish before their session is closed
+        executor.shutdown(wait=True, cancel_futures=True)
+        session.close()
     
     print("\n❌ Failed to connect to TrueNAS Scale API")
     return {"success": False}
@@ -6,10 +6,31 @@ import json
 import os
 import sys
 import requests
-import getpass
-from pprint import pprint
+import ipaddress
+import ssl
 import time
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional; it is considerably faster on large responses such as pool/dataset
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class SharedSSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose HTTPS connections all use one prebuilt SSL context"""
+    
+    def __init__(self, ssl_context, **kwargs):
+        # Set before the base class builds the pool manager
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
 
 class TrueNASClient:
     """Client for interacting with TrueNAS Scale API"""
@@ -34,13 +55,50 @@ class TrueNASClient:
             
         print(f"Connecting to TrueNAS API at: {self.base_url}")
         
+        # GET responses keyed by (endpoint, params); the data is static for the
+        # duration of a run apart from our own writes, which invalidate it
+        self._cache = {}
+        
         self.session = requests.Session()
         self.session.verify = ssl_verify
         
-        # Disable SSL warnings if verification is disabled
-        if not ssl_verify:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # Keep connections alive across the discovery and configuration calls. A
+        # blocking pool caps the requests in flight against the middleware at 16,
+        # however many worker threads are issuing them, and transient errors and
+        # rate limiting on idempotent requests are retried with exponential
+        # backoff, waiting for Retry-After when the server sends one
+        adapter_args = dict(
+            pool_connections=16,
+            pool_maxsize=16,
+            pool_block=True,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.2,
+                backoff_max=5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        if use_https and not ssl_verify:
+            # Without verification urllib3 would build a fresh SSL context for every
+            # new connection; build the unverified context once and share it
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            adapter = SharedSSLContextAdapter(ssl_context, **adapter_args)
+        else:
+            adapter = HTTPAdapter(**adapter_args)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # A loopback API is never reached through a proxy, so skip the proxy and
+        # netrc environment lookups requests otherwise repeats on every call
+        if is_loopback(host):
+            self.session.trust_env = False
+        
+        # Disable SSL warnings if verification is disabled; plain HTTP never warns
+        if use_https and not ssl_verify:
+            disable_insecure_request_warnings()
         
         if api_key:
             self.session.headers.update({
@@ -54,7 +112,8 @@ class TrueNASClient:
         # Add common headers
         self.session.headers.update({
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            "Connection": "keep-alive"
         })
         
         # Test connection
@@ -67,102 +126,165 @@ class TrueNASClient:
     
     def get(self, endpoint, params=None):
         """Make a GET request to the TrueNAS API"""
-        url = urljoin(self.base_url, endpoint)
+        key = (endpoint, frozenset(params.items()) if params else None)
+        if key in self._cache:
+            return self._cache[key]
+        
+        url = self._url(endpoint)
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        result = self._cache[key] = self._decode(response)
+        return result
+    
+    def prefetch(self, endpoints):
+        """Issue independent GET requests concurrently to warm the cache
+        
+        Failed requests are not cached, so the later get() retries them and
+        raises in the caller's context.
+        """
+        def fetch(endpoint):
+            try:
+                self.get(endpoint)
+            except Exception:
+                pass
+        
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            list(executor.map(fetch, endpoints))
+    
+    def invalidate(self, prefix):
+        """Drop cached GET responses for endpoints under the given prefix"""
+        # Snapshot the keys, as concurrent requests may be updating the cache
+        for key in list(self._cache):
+            if key[0].startswith(prefix):
+                self._cache.pop(key, None)
     
     def post(self, endpoint, data):
         """Make a POST request to the TrueNAS API"""
-        url = urljoin(self.base_url, endpoint)
-        response = self.session.post(url, json=data)
+        url = self._url(endpoint)
+        response = self.session.post(url, **self._encode(data))
+        self.invalidate(endpoint.split("/", 1)[0])
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
     
     def put(self, endpoint, data):
         """Make a PUT request to the TrueNAS API"""
-        url = urljoin(self.base_url, endpoint)
-        response = self.session.put(url, json=data)
+        url = self._url(endpoint)
+        response = self.session.put(url, **self._encode(data))
+        self.invalidate(endpoint.split("/", 1)[0])
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
     
     def delete(self, endpoint):
         """Make a DELETE request to the TrueNAS API"""
-        url = urljoin(self.base_url, endpoint)
+        url = self._url(endpoint)
         response = self.session.delete(url)
+        self.invalidate(endpoint.split("/", 1)[0])
         response.raise_for_status()
+        return self._decode(response)
+    
+    def _url(self, endpoint):
+        """Absolute URL for an endpoint, which is always relative to base_url"""
+        assert "://" not in endpoint, f"Expected a relative API endpoint, got {endpoint}"
+        # base_url ends with a slash, so plain concatenation avoids urljoin's parsing
+        return self.base_url + endpoint.lstrip("/")
+    
+    @staticmethod
+    def _encode(data):
+        """Request arguments carrying data as the JSON body"""
+        if orjson is not None:
+            # The session already sends the JSON Content-Type header
+            return {"data": orjson.dumps(data)}
+        return {"json": data}
+    
+    @staticmethod
+    def _decode(response):
+        """Parse the JSON body of a response"""
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
 class TrueNASDiscovery:
-    """Class to discover and configure TrueNAS for OpenShift multiboot"""
+    """Class to discover and configure TrueNAS for OpenShift multiboot
+    
+    Each discovery result is a cached property: the first access fetches and
+    reports it, and every later access reuses that result.
+    """
     
     def __init__(self, client):
         self.client = client
-        self.system_info = None
-        self.pools = None
-        self.datasets = None
-        self.zvols = None
-        self.iscsi_targets = None
-        self.iscsi_extents = None
-        self.sharing_nfs = None
+        self._datasets_by_type = {}
+        self._datasets_by_path = {}
         self.openshift_versions = ["4.16", "4.17", "4.18"]  # Versions we want to support
     
-    def discover_system(self):
-        """Get basic system information"""
+    @cached_property
+    def system_info(self):
+        """Basic system information"""
         print("\n🔍 Discovering TrueNAS system information...")
-        self.system_info = self.client.get("system/info")
-        print(f"System: {self.system_info['hostname']} ({self.system_info['system_product']})")
-        print(f"Version: {self.system_info['version']}")
-        return self.system_info
+        system_info = self.client.get("system/info")
+        print(f"System: {system_info['hostname']} ({system_info['system_product']})")
+        print(f"Version: {system_info['version']}")
+        return system_info
     
-    def discover_pools(self):
-        """Discover ZFS pools"""
+    @cached_property
+    def pools(self):
+        """ZFS pools"""
         print("\n🔍 Discovering ZFS pools...")
-        self.pools = self.client.get("pool")
+        pools = self.client.get("pool")
         
-        if not self.pools:
+        if not pools:
             print("❌ No ZFS pools found")
-            return None
+            return pools
         
-        print(f"Found {len(self.pools)} ZFS pools:")
-        for pool in self.pools:
+        # Per-row lines are collected and written in one call rather than one print each
+        lines = [f"Found {len(pools)} ZFS pools:"]
+        for pool in pools:
             status = "✅ Online" if pool["status"] == "ONLINE" else f"❌ {pool['status']}"
-            print(f"- {pool['name']}: {status}, Size: {format_size(pool['size'])}")
+            lines.append(f"- {pool['name']}: {status}, Size: {format_size(pool['size'])}")
+        print("\n".join(lines))
         
-        return self.pools
+        return pools
     
-    def discover_datasets(self):
-        """Discover ZFS datasets"""
+    @cached_property
+    def datasets(self):
+        """ZFS datasets"""
         print("\n🔍 Discovering ZFS datasets...")
-        self.datasets = self.client.get("pool/dataset")
+        datasets = self.client.get("pool/dataset")
         
-        if not self.datasets:
-            print("No ZFS datasets found")
-            return None
+        # Bucket datasets by type and by their path below the pool in one pass, so
+        # zvol discovery and the analysis are lookups rather than scans; for paths
+        # present in several pools the first match wins
+        for dataset in datasets or []:
+            self._datasets_by_type.setdefault(dataset.get("type"), []).append(dataset)
+            self._datasets_by_path.setdefault(dataset["name"].partition("/")[2], dataset)
         
-        print(f"Found {len(self.datasets)} ZFS datasets")
-        return self.datasets
+        if not datasets:
+            print("No ZFS datasets found")
+        else:
+            print(f"Found {len(datasets)} ZFS datasets")
+        return datasets
     
-    def discover_zvols(self):
-        """Discover ZFS zvols"""
-        print("\n🔍 Discovering ZFS zvols...")
-        self.zvols = []
+    @cached_property
+    def zvols(self):
+        """ZFS zvols, taken from the datasets"""
+        # Discovering the datasets builds the type buckets
+        self.discover_datasets()
         
-        for dataset in self.datasets:
-            if dataset.get("type") == "VOLUME":
-                self.zvols.append(dataset)
+        print("\n🔍 Discovering ZFS zvols...")
+        zvols = self._datasets_by_type.get("VOLUME", [])
         
-        if not self.zvols:
+        if not zvols:
             print("No ZFS zvols found")
         else:
-            print(f"Found {len(self.zvols)} ZFS zvols:")
-            for zvol in self.zvols:
-                print(f"- {zvol['name']}: Size: {format_size(zvol['volsize']['parsed'])}")
+            lines = [f"Found {len(zvols)} ZFS zvols:"]
+            for zvol in zvols:
+                lines.append(f"- {zvol['name']}: Size: {format_size(zvol['volsize']['parsed'])}")
+            print("\n".join(lines))
         
-        return self.zvols
+        return zvols
     
-    def discover_iscsi_configuration(self):
-        """Discover iSCSI configuration"""
+    @cached_property
+    def iscsi_configuration(self):
+        """iSCSI service, targets and extents"""
         print("\n🔍 Discovering iSCSI configuration...")
         
         # Check if iSCSI service is running
@@ -171,7 +293,7 @@ class TrueNASDiscovery:
         
         if not iscsi_service:
             print("❌ iSCSI service not found")
-            return None
+            return {"service": None, "targets": None, "extents": None}
         
         if not iscsi_service["enable"]:
             print("⚠️ iSCSI service is not enabled")
@@ -182,51 +304,99 @@ class TrueNASDiscovery:
             print("✅ iSCSI service is running")
         
         # Get iSCSI targets
-        self.iscsi_targets = self.client.get("iscsi/target")
-        print(f"Found {len(self.iscsi_targets)} iSCSI targets")
+        iscsi_targets = self.client.get("iscsi/target")
+        print(f"Found {len(iscsi_targets)} iSCSI targets")
         
         # Get iSCSI extents
-        self.iscsi_extents = self.client.get("iscsi/extent")
-        print(f"Found {len(self.iscsi_extents)} iSCSI extents")
+        iscsi_extents = self.client.get("iscsi/extent")
+        print(f"Found {len(iscsi_extents)} iSCSI extents")
         
         return {
             "service": iscsi_service,
-            "targets": self.iscsi_targets,
-            "extents": self.iscsi_extents
+            "targets": iscsi_targets,
+            "extents": iscsi_extents
         }
     
-    def discover_nfs_shares(self):
-        """Discover NFS shares"""
+    @property
+    def iscsi_service(self):
+        return self.iscsi_configuration["service"]
+    
+    @property
+    def iscsi_targets(self):
+        return self.iscsi_configuration["targets"]
+    
+    @property
+    def iscsi_extents(self):
+        return self.iscsi_configuration["extents"]
+    
+    @cached_property
+    def sharing_nfs(self):
+        """NFS shares"""
         print("\n🔍 Discovering NFS shares...")
         try:
-            self.sharing_nfs = self.client.get("sharing/nfs")
-            
-            if not self.sharing_nfs:
-                print("No NFS shares found")
-            else:
-                print(f"Found {len(self.sharing_nfs)} NFS shares:")
-                for share in self.sharing_nfs:
-                    # Handle different API structures safely
-                    paths = []
-                    if isinstance(share.get("paths"), list):
-                        paths = share["paths"]
-                    elif "path" in share:
-                        paths = [share["path"]]
-                    
-                    if paths:
-                        paths_str = ", ".join(paths)
-                        enabled = share.get("enabled", False)
-                        print(f"- {paths_str} (Enabled: {'✅' if enabled else '❌'})")
-                    else:
-                        print(f"- {share.get('id', 'Unknown')} (Path info unavailable)")
-            
-            return self.sharing_nfs
+            sharing_nfs = self.client.get("sharing/nfs")
         except Exception as e:
             print(f"⚠️ Error discovering NFS shares: {e}")
             return []
+        
+        if not sharing_nfs:
+            print("No NFS shares found")
+        else:
+            lines = [f"Found {len(sharing_nfs)} NFS shares:"]
+            for share in sharing_nfs:
+                # Handle different API structures safely
+                paths = []
+                if isinstance(share.get("paths"), list):
+                    paths = share["paths"]
+                elif "path" in share:
+                    paths = [share["path"]]
+                
+                if paths:
+                    paths_str = ", ".join(paths)
+                    enabled = share.get("enabled", False)
+                    lines.append(f"- {paths_str} (Enabled: {'✅' if enabled else '❌'})")
+                else:
+                    lines.append(f"- {share.get('id', 'Unknown')} (Path info unavailable)")
+            print("\n".join(lines))
+        
+        return sharing_nfs
+    
+    def discover_system(self):
+        """Get basic system information"""
+        return self.system_info
+    
+    def discover_pools(self):
+        """Discover ZFS pools"""
+        return self.pools or None
+    
+    def discover_datasets(self):
+        """Discover ZFS datasets"""
+        return self.datasets or None
+    
+    def discover_zvols(self):
+        """Discover ZFS zvols"""
+        return self.zvols
+    
+    def discover_iscsi_configuration(self):
+        """Discover iSCSI configuration"""
+        if not self.iscsi_service:
+            return None
+        return self.iscsi_configuration
+    
+    def discover_nfs_shares(self):
+        """Discover NFS shares"""
+        return self.sharing_nfs
     
     def discover_all(self):
         """Run all discovery functions"""
+        # The discovery endpoints do not depend on each other, so fetch them all
+        # concurrently; the properties below then only report the results
+        self.client.prefetch([
+            "system/info", "pool", "pool/dataset", "service",
+            "iscsi/target", "iscsi/extent", "sharing/nfs"
+        ])
+        
+        # Each discovery fetches and reports its result only once
         self.discover_system()
         self.discover_pools()
         self.discover_datasets()
@@ -248,17 +418,11 @@ class TrueNASDiscovery:
     
     def analyze_configuration(self):
         """Analyze current configuration and compare with required configuration"""
-        if not self.pools:
-            self.discover_pools()
-        
-        if not self.datasets:
-            self.discover_datasets()
-        
-        if not self.zvols:
-            self.discover_zvols()
-        
-        if not self.iscsi_targets:
-            self.discover_iscsi_configuration()
+        # Make sure discovery has been reported before the analysis output
+        self.discover_pools()
+        self.discover_datasets()
+        self.discover_zvols()
+        self.discover_iscsi_configuration()
         
         print("\n📊 Analyzing configuration for OpenShift multiboot compatibility...")
         
@@ -271,74 +435,21 @@ class TrueNASDiscovery:
         largest_pool = max(self.pools, key=lambda p: p["size"])
         print(f"Selected pool '{largest_pool['name']}' for OpenShift multiboot configuration")
         
-        # Check for openshift_isos dataset
-        openshift_isos_dataset = None
-        for dataset in self.datasets:
-            if dataset["name"].endswith("/openshift_isos"):
-                openshift_isos_dataset = dataset
-                break
-        
-        if not openshift_isos_dataset:
-            print(f"⚠️ Missing dataset '{largest_pool['name']}/openshift_isos'")
-        else:
-            print(f"✅ Found dataset '{openshift_isos_dataset['name']}'")
-        
-        # Check for openshift_installations dataset
-        openshift_installations_dataset = None
-        for dataset in self.datasets:
-            if dataset["name"].endswith("/openshift_installations"):
-                openshift_installations_dataset = dataset
-                break
-        
-        if not openshift_installations_dataset:
-            print(f"⚠️ Missing dataset '{largest_pool['name']}/openshift_installations'")
-        else:
-            print(f"✅ Found dataset '{openshift_installations_dataset['name']}'")
-        
-        # Check for version-specific datasets
-        for version in self.openshift_versions:
-            version_dataset = None
-            for dataset in self.datasets:
-                if dataset["name"].endswith(f"/openshift_isos/{version}"):
-                    version_dataset = dataset
-                    break
-            
-            if not version_dataset:
-                print(f"⚠️ Missing dataset '{largest_pool['name']}/openshift_isos/{version}'")
-            else:
-                print(f"✅ Found dataset '{version_dataset['name']}'")
-        
-        # Check for zvols
-        for version in self.openshift_versions:
-            version_fmt = version.replace(".", "_")
-            version_zvol = None
-            for zvol in self.zvols:
-                if zvol["name"].endswith(f"/openshift_installations/{version_fmt}_complete"):
-                    version_zvol = zvol
-                    break
-            
-            if not version_zvol:
-                print(f"⚠️ Missing zvol '{largest_pool['name']}/openshift_installations/{version_fmt}_complete'")
-            else:
-                print(f"✅ Found zvol '{version_zvol['name']}'")
-        
-        # Check for iSCSI targets
-        for version in self.openshift_versions:
-            version_fmt = version.replace(".", "_")
-            version_target = None
-            for target in self.iscsi_targets:
-                if f"openshift{version_fmt}" in target["name"] or f"openshift_{version_fmt}" in target["name"]:
-                    version_target = target
-                    break
-            
-            if not version_target:
-                print(f"⚠️ Missing iSCSI target for OpenShift {version}")
-            else:
-                print(f"✅ Found iSCSI target '{version_target['name']}' for OpenShift {version}")
-        
-        # Generate configuration plan
-        print("\n📋 Configuration Plan:")
+        # Index zvols by their path below the pool as the datasets property does for all
+        # datasets, so each check is a single lookup; the first match wins, as before
+        zvols_by_path = {}
+        for zvol in self.zvols:
+            zvols_by_path.setdefault(zvol["name"].partition("/")[2], zvol)
+        
+        # Dotted and underscored form of each version, and the name fragments that
+        # identify an existing iSCSI target for it, computed once for all checks
+        versions = [(version, version.replace(".", "_")) for version in self.openshift_versions]
+        target_patterns = {
+            version: (f"openshift{version_fmt}", f"openshift_{version_fmt}")
+            for version, version_fmt in versions
+        }
         
+        # Missing resources are added to the plan in the same pass that reports them
         config_plan = {
             "pool": largest_pool["name"],
             "missing_datasets": [],
@@ -346,53 +457,47 @@ class TrueNASDiscovery:
             "missing_iscsi_targets": []
         }
         
-        # Check for missing datasets
-        if not openshift_isos_dataset:
-            config_plan["missing_datasets"].append(f"{largest_pool['name']}/openshift_isos")
-        
-        if not openshift_installations_dataset:
-            config_plan["missing_datasets"].append(f"{largest_pool['name']}/openshift_installations")
+        # Check for the openshift_isos, openshift_installations and version-specific datasets
+        dataset_paths = ["openshift_isos", "openshift_installations"]
+        dataset_paths += [f"openshift_isos/{version}" for version in self.openshift_versions]
+        for path in dataset_paths:
+            if dataset := self._datasets_by_path.get(path):
+                print(f"✅ Found dataset '{dataset['name']}'")
+            else:
+                print(f"⚠️ Missing dataset '{largest_pool['name']}/{path}'")
+                config_plan["missing_datasets"].append(f"{largest_pool['name']}/{path}")
         
-        for version in self.openshift_versions:
-            version_dataset = None
-            for dataset in self.datasets:
-                if dataset["name"].endswith(f"/openshift_isos/{version}"):
-                    version_dataset = dataset
-                    break
-            
-            if not version_dataset:
-                config_plan["missing_datasets"].append(f"{largest_pool['name']}/openshift_isos/{version}")
-        
-        # Check for missing zvols
-        for version in self.openshift_versions:
-            version_fmt = version.replace(".", "_")
-            version_zvol = None
-            for zvol in self.zvols:
-                if zvol["name"].endswith(f"/openshift_installations/{version_fmt}_complete"):
-                    version_zvol = zvol
-                    break
-            
-            if not version_zvol:
+        # Check for zvols
+        for version, version_fmt in versions:
+            path = f"openshift_installations/{version_fmt}_complete"
+            if version_zvol := zvols_by_path.get(path):
+                print(f"✅ Found zvol '{version_zvol['name']}'")
+            else:
+                print(f"⚠️ Missing zvol '{largest_pool['name']}/{path}'")
                 config_plan["missing_zvols"].append({
-                    "name": f"{largest_pool['name']}/openshift_installations/{version_fmt}_complete",
+                    "name": f"{largest_pool['name']}/{path}",
                     "volsize": 500 * 1024 * 1024 * 1024  # 500GB
                 })
         
-        # Check for missing iSCSI targets
-        for version in self.openshift_versions:
-            version_fmt = version.replace(".", "_")
-            version_target = None
-            for target in self.iscsi_targets:
-                if f"openshift{version_fmt}" in target["name"] or f"openshift_{version_fmt}" in target["name"]:
-                    version_target = target
-                    break
+        # Check for iSCSI targets
+        for version, version_fmt in versions:
+            patterns = target_patterns[version]
+            version_target = next(
+                (t for t in self.iscsi_targets if any(p in t["name"] for p in patterns)), None
+            )
             
             if not version_target:
+                print(f"⚠️ Missing iSCSI target for OpenShift {version}")
                 config_plan["missing_iscsi_targets"].append({
                     "name": f"openshift_{version_fmt}",
                     "alias": f"OpenShift {version}",
                     "iqn": f"iqn.2005-10.org.freenas.ctl:iscsi.r630.openshift{version_fmt}"
                 })
+            else:
+                print(f"✅ Found iSCSI target '{version_target['name']}' for OpenShift {version}")
+        
+        # Generate configuration plan
+        print("\n📋 Configuration Plan:")
         
         return config_plan
     
@@ -421,167 +526,214 @@ class TrueNASDiscovery:
                 print("Configuration cancelled")
                 return False
         
-        # Create missing datasets
+        # Collect the dataset and zvol creations, both of which go through pool/dataset
+        creations = []
         for dataset_name in config_plan["missing_datasets"]:
-            print(f"Creating dataset {dataset_name}...")
-            try:
-                dataset_data = {
-                    "name": dataset_name,
-                    "type": "FILESYSTEM",
-                    "sync": "STANDARD",
-                    "compression": "LZ4"
-                }
-                self.client.post("pool/dataset", dataset_data)
-                print(f"✅ Created dataset {dataset_name}")
-            except Exception as e:
-                print(f"❌ Failed to create dataset {dataset_name}: {e}")
+            creations.append(("dataset", {
+                "name": dataset_name,
+                "type": "FILESYSTEM",
+                "sync": "STANDARD",
+                "compression": "LZ4"
+            }))
         
-        # Create missing zvols
         for zvol in config_plan["missing_zvols"]:
-            print(f"Creating zvol {zvol['name']}...")
+            creations.append(("zvol", {
+                "name": zvol["name"],
+                "type": "VOLUME",
+                "volsize": zvol["volsize"],
+                "sync": "STANDARD",
+                "compression": "LZ4",
+                "sparse": True
+            }))
+        
+        def create(kind, data):
+            """Create a single dataset or zvol, returning the outcome to report"""
             try:
-                zvol_data = {
-                    "name": zvol["name"],
-                    "type": "VOLUME",
-                    "volsize": zvol["volsize"],
-                    "sync": "STANDARD",
-                    "compression": "LZ4",
-                    "sparse": True
-                }
-                self.client.post("pool/dataset", zvol_data)
-                print(f"✅ Created zvol {zvol['name']}")
+                self.client.post("pool/dataset", data)
+                return f"✅ Created {kind} {data['name']}"
             except Exception as e:
-                print(f"❌ Failed to create zvol {zvol['name']}: {e}")
+                return f"❌ Failed to create {kind} {data['name']}: {e}"
+        
+        # Siblings have no ordering dependency, so each nesting level is created
+        # concurrently; parents are complete before the next level starts
+        levels = {}
+        for kind, data in creations:
+            levels.setdefault(data["name"].count("/"), []).append((kind, data))
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for depth in sorted(levels):
+                for kind, data in levels[depth]:
+                    print(f"Creating {kind} {data['name']}...")
+                for outcome in executor.map(lambda item: create(*item), levels[depth]):
+                    print(outcome)
+        
+        # Map each planned target name back to its dotted and underscored version
+        versions = [(version, version.replace(".", "_")) for version in self.openshift_versions]
+        target_versions = {f"openshift_{version_fmt}": (version, version_fmt) for version, version_fmt in versions}
         
         # Create missing iSCSI targets
         if config_plan["missing_iscsi_targets"]:
-            # First check if the iSCSI service is running
-            services = self.client.get("service")
-            iscsi_service = next((s for s in services if s["service"] == "iscsitarget"), None)
+            # First check if the iSCSI service is running, reusing the discovered state
+            iscsi_service = self.iscsi_service
             
             if not iscsi_service or not iscsi_service["state"] == "RUNNING":
                 print("⚠️ iSCSI service is not running. Targets will be created but may not be accessible.")
-        
-        for target in config_plan["missing_iscsi_targets"]:
-            print(f"Creating iSCSI target {target['name']}...")
+            
+            # Every target uses the same portal and initiator group, so resolve them
+            # once before creating any target; both lookups are fetched together
+            self.client.prefetch(["iscsi/portal", "iscsi/initiator"])
+            
             try:
                 # First check if a portal exists
                 portals = self.client.get("iscsi/portal")
-                if not portals:
-                    print("⚠️ No iSCSI portals found. Creating a default portal...")
-                    portal_data = {
-                        "comment": "Default portal for OpenShift multiboot",
-                        "discovery_authmethod": "NONE",
-                        "discovery_authgroup": None,
-                        "listen": [
-                            {
-                                "ip": "0.0.0.0",
-                                "port": 3260
-                            }
-                        ]
-                    }
-                    try:
-                        portal_result = self.client.post("iscsi/portal", portal_data)
-                        print(f"✅ Created default iSCSI portal")
-                        portal_id = portal_result["id"]
-                    except Exception as e:
-                        print(f"❌ Failed to create iSCSI portal: {e}")
-                        portal_id = 1  # Try with default portal ID
-                else:
-                    portal_id = portals[0]["id"]
-                    print(f"✅ Using existing iSCSI portal ID {portal_id}")
                 
                 # First check if initiator groups exist
                 initiator_groups = self.client.get("iscsi/initiator")
-                if not initiator_groups:
-                    print("⚠️ No iSCSI initiator groups found. Creating a default group...")
-                    initiator_data = {
-                        "comment": "Default initiator group for OpenShift multiboot",
-                        "initiators": ["ALL"],
-                    }
-                    try:
-                        initiator_result = self.client.post("iscsi/initiator", initiator_data)
-                        print(f"✅ Created default iSCSI initiator group")
-                        initiator_id = initiator_result["id"]
-                    except Exception as e:
-                        print(f"❌ Failed to create iSCSI initiator group: {e}")
-                        initiator_id = 1  # Try with default initiator ID
-                else:
-                    initiator_id = initiator_groups[0]["id"]
-                    print(f"✅ Using existing iSCSI initiator group ID {initiator_id}")
-                
-                # The IQN must be in the correct format with colons intact
-                iqn = target["iqn"].replace(" ", "-")
-                
-                # Create the target with correct format according to TrueNAS SCALE 24.10
-                target_data = {
-                    "name": iqn,
-                    "alias": target["alias"],
-                    "mode": "ISCSI",
-                    "groups": [
+            except Exception as e:
+                print(f"❌ Failed to look up iSCSI portals and initiator groups: {e}")
+                return False
+            
+            if not portals:
+                print("⚠️ No iSCSI portals found. Creating a default portal...")
+                portal_data = {
+                    "comment": "Default portal for OpenShift multiboot",
+                    "discovery_authmethod": "NONE",
+                    "discovery_authgroup": None,
+                    "listen": [
                         {
-                            "portal": portal_id,
-                            "initiator": initiator_id,
-                            "auth": None,  # No authentication
-                            "authmethod": "NONE"
+                            "ip": "0.0.0.0",
+                            "port": 3260
                         }
                     ]
                 }
-                
-                print(f"Sending iSCSI target creation request: {json.dumps(target_data, indent=2)}")
-                target_result = self.client.post("iscsi/target", target_data)
-                print(f"✅ Created iSCSI target {target['name']}")
-                
-                # Get the new target ID
-                target_id = target_result["id"]
-                
-                # Now we need to create an extent and bind it to the target
-                # First, find the zvol for this target
-                version = target["name"].split("_")[-1].replace("_", ".")
-                version_fmt = version.replace(".", "_")
-                zvol_name = f"{config_plan['pool']}/openshift_installations/{version_fmt}_complete"
-                
-                # Create an extent for the zvol
-                extent_data = {
-                    "name": f"openshift_{version_fmt}_extent",
-                    "type": "DISK",
-                    "disk": f"zvol/{zvol_name}",
-                    "blocksize": 512,
-                    "pblocksize": False,
-                    "avail_threshold": None,
-                    "comment": f"OpenShift {version} boot image",
-                    "insecure_tpc": True,
-                    "xen": False,
-                    "rpm": "SSD",
-                    "ro": False
-                }
-                
-                extent_result = self.client.post("iscsi/extent", extent_data)
-                print(f"✅ Created iSCSI extent for {zvol_name}")
-                
-                # Bind the extent to the target
-                targetextent_data = {
-                    "target": target_id,
-                    "extent": extent_result["id"],
-                    "lunid": 0
+                try:
+                    portal_result = self.client.post("iscsi/portal", portal_data)
+                    print(f"✅ Created default iSCSI portal")
+                    portal_id = portal_result["id"]
+                except Exception as e:
+                    print(f"❌ Failed to create iSCSI portal: {e}")
+                    portal_id = 1  # Try with default portal ID
+            else:
+                portal_id = portals[0]["id"]
+                print(f"✅ Using existing iSCSI portal ID {portal_id}")
+            
+            if not initiator_groups:
+                print("⚠️ No iSCSI initiator groups found. Creating a default group...")
+                initiator_data = {
+                    "comment": "Default initiator group for OpenShift multiboot",
+                    "initiators": ["ALL"],
                 }
-                
-                self.client.post("iscsi/targetextent", targetextent_data)
-                print(f"✅ Bound extent to target {target['name']}")
-                
-            except Exception as e:
-                print(f"❌ Failed to create iSCSI target {target['name']}: {e}")
+                try:
+                    initiator_result = self.client.post("iscsi/initiator", initiator_data)
+                    print(f"✅ Created default iSCSI initiator group")
+                    initiator_id = initiator_result["id"]
+                except Exception as e:
+                    print(f"❌ Failed to create iSCSI initiator group: {e}")
+                    initiator_id = 1  # Try with default initiator ID
+            else:
+                initiator_id = initiator_groups[0]["id"]
+                print(f"✅ Using existing iSCSI initiator group ID {initiator_id}")
+            
+            def create_target(target):
+                """Create a target with its extent and binding, returning the lines to report"""
+                lines = [f"Creating iSCSI target {target['name']}..."]
+                try:
+                    # The IQN must be in the correct format with colons intact
+                    iqn = target["iqn"].replace(" ", "-")
+                    
+                    # Create the target with correct format according to TrueNAS SCALE 24.10
+                    target_data = {
+                        "name": iqn,
+                        "alias": target["alias"],
+                        "mode": "ISCSI",
+                        "groups": [
+                            {
+                                "portal": portal_id,
+                                "initiator": initiator_id,
+                                "auth": None,  # No authentication
+                                "authmethod": "NONE"
+                            }
+                        ]
+                    }
+                    
+                    lines.append(f"Sending iSCSI target creation request: {json.dumps(target_data, indent=2)}")
+                    target_result = self.client.post("iscsi/target", target_data)
+                    lines.append(f"✅ Created iSCSI target {target['name']}")
+                    
+                    # Get the new target ID
+                    target_id = target_result["id"]
+                    
+                    # Now we need to create an extent and bind it to the target
+                    # First, find the zvol for this target
+                    version, version_fmt = target_versions[target["name"]]
+                    zvol_name = f"{config_plan['pool']}/openshift_installations/{version_fmt}_complete"
+                    
+                    # Create an extent for the zvol
+                    extent_data = {
+                        "name": f"openshift_{version_fmt}_extent",
+                        "type": "DISK",
+                        "disk": f"zvol/{zvol_name}",
+                        "blocksize": 512,
+                        "pblocksize": False,
+                        "avail_threshold": None,
+                        "comment": f"OpenShift {version} boot image",
+                        "insecure_tpc": True,
+                        "xen": False,
+                        "rpm": "SSD",
+                        "ro": False
+                    }
+                    
+                    extent_result = self.client.post("iscsi/extent", extent_data)
+                    lines.append(f"✅ Created iSCSI extent for {zvol_name}")
+                    
+                    # Bind the extent to the target
+                    targetextent_data = {
+                        "target": target_id,
+                        "extent": extent_result["id"],
+                        "lunid": 0
+                    }
+                    
+                    self.client.post("iscsi/targetextent", targetextent_data)
+                    lines.append(f"✅ Bound extent to target {target['name']}")
+                    
+                except Exception as e:
+                    lines.append(f"❌ Failed to create iSCSI target {target['name']}: {e}")
+                return lines
+            
+            # With the portal and initiator group settled the targets are independent;
+            # each target's own target/extent/binding chain stays in order
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for lines in executor.map(create_target, config_plan["missing_iscsi_targets"]):
+                    print("\n".join(lines))
         
         print("\n✅ Configuration applied successfully")
         return True
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_size(size_in_bytes):
     """Format size in bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
-        if size_in_bytes < 1024.0 or unit == 'PB':
-            break
-        size_in_bytes /= 1024.0
-    return f"{size_in_bytes:.2f} {unit}"
+    # Each unit spans 10 bits, so the bit length selects it without a division loop
+    if size_in_bytes < 1024:
+        index = 0
+    else:
+        index = min((int(size_in_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_in_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
+
+def is_loopback(host):
+    """Check whether a hostname or IP address refers to this machine"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host.strip("[]")).is_loopback
+    except ValueError:
+        return False
+
+@lru_cache(maxsize=1)
+def disable_insecure_request_warnings():
+    """Silence urllib3's unverified HTTPS warnings once per process"""
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 def main():
     parser = argparse.ArgumentParser(description="Discover and configure TrueNAS Scale for OpenShift multiboot")
@@ -601,6 +753,7 @@ def main():
     # Get password if not provided
     password = args.password
     if not password and not args.api_key:
+        import getpass
         password = getpass.getpass(f"Password for {args.username}@{args.host}: ")
     
     try:
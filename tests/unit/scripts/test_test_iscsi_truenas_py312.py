@@ -13,6 +13,7 @@ import unittest
 from unittest.mock import MagicMock, patch, mock_open
 import argparse
 import logging
+import tempfile
 from pathlib import Path
 import getpass
 
@@ -46,7 +47,8 @@ class TestISCSITrueNasPy312(unittest.TestCase):
             cleanup=False,
             discover_only=False,
             verbose=False,
-            dry_run=False
+            dry_run=False,
+            cache_ttl=0
         )
         
     def test_create_iscsi_config(self):
@@ -65,6 +67,24 @@ class TestISCSITrueNasPy312(unittest.TestCase):
         self.assertEqual(config['dry_run'], False)
         self.assertEqual(config['discover_only'], False)
 
+    def test_discovery_cache_round_trip(self):
+        """Test that cached discovery results are reused until they expire."""
+        # Arrange
+        discovery_results = {'connectivity': True, 'pools': [{'name': 'test'}]}
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch('scripts.test_iscsi_truenas_py312.DISCOVERY_CACHE_DIR', Path(cache_dir)):
+                cache_path = iscsi_script.discovery_cache_path(self.mock_args)
+                
+                # Act
+                self.assertIsNone(iscsi_script.load_cached_discovery(cache_path, 60))
+                iscsi_script.store_discovery(cache_path, discovery_results)
+                
+                # Assert
+                self.assertEqual(iscsi_script.load_cached_discovery(cache_path, 60), discovery_results)
+                os.utime(cache_path, (0, 0))
+                self.assertIsNone(iscsi_script.load_cached_discovery(cache_path, 60))
+    
     def test_display_discovery_results_successful_connectivity(self):
         """Test displaying discovery results when connectivity is successful."""
         # Arrange
@@ -96,7 +116,7 @@ class TestISCSITrueNasPy312(unittest.TestCase):
             connectivity_message_found = False
             for call in mock_info.call_args_list:
                 args, _ = call
-                if args and 'TrueNAS connectivity: True' in args[0]:
+                if args and 'TrueNAS connectivity: True' in args[0] % args[1:]:
                     connectivity_message_found = True
                     break
             self.assertTrue(connectivity_message_found)
@@ -114,7 +134,7 @@ class TestISCSITrueNasPy312(unittest.TestCase):
             iscsi_script.display_discovery_results(discovery_results, self.mock_args, self.logger)
             
             # Assert
-            mock_error.assert_called_with('TrueNAS connectivity failed: Test connection error')
+            mock_error.assert_called_with('TrueNAS connectivity failed: %s', 'Test connection error')
 
     def test_display_processing_results_successful(self):
         """Test displaying processing results for successful operations."""
@@ -138,7 +158,7 @@ class TestISCSITrueNasPy312(unittest.TestCase):
             target_id_message_found = False
             for call in mock_info.call_args_list:
                 args, _ = call
-                if args and '- Target ID: 1' in args[0]:
+                if args and '- Target ID: 1' in args[0] % args[1:]:
                     target_id_message_found = True
                     break
             self.assertTrue(target_id_message_found)
@@ -177,7 +197,7 @@ class TestISCSITrueNasPy312(unittest.TestCase):
             iscsi_script.display_housekeeping_results(housekeeping_results, self.logger)
             
             # Assert
-            mock_warning.assert_called_with('  - Failed to clean resource X')
+            mock_warning.assert_called_once_with('Housekeeping warnings:\n%s', '  - Failed to clean resource X')
 
     @patch('scripts.test_iscsi_truenas_py312.getpass.getpass')
     @patch('scripts.test_iscsi_truenas_py312.ISCSIComponent')
@@ -208,9 +228,10 @@ class TestISCSITrueNasPy312(unittest.TestCase):
                 mock_iscsi_component_class.assert_called_once()
                 mock_iscsi_component.discover.assert_called_once()
 
+    @patch('scripts.test_iscsi_truenas_py312.keyring')
     @patch('scripts.test_iscsi_truenas_py312.getpass.getpass')
     @patch('scripts.test_iscsi_truenas_py312.ISCSIComponent')
-    def test_main_prompt_for_api_key(self, mock_iscsi_component_class, mock_getpass):
+    def test_main_prompt_for_api_key(self, mock_iscsi_component_class, mock_getpass, mock_keyring):
         """Test main function when API key is prompted."""
         # Arrange
         mock_iscsi_component = MagicMock()
@@ -222,8 +243,9 @@ class TestISCSITrueNasPy312(unittest.TestCase):
             'iscsi_service': True
         }
         
-        # Configure getpass to return API key
+        # Configure getpass to return API key, with nothing stored in the keyring
         mock_getpass.return_value = "prompted_api_key"
+        mock_keyring.get_password.return_value = None
         
         # Configure args
         mock_args = self.mock_args
@@ -241,8 +263,13 @@ class TestISCSITrueNasPy312(unittest.TestCase):
                 mock_iscsi_component_class.assert_called_once()
                 
                 # Verify API key was passed correctly
-                _, kwargs = mock_iscsi_component_class.call_args
-                self.assertEqual(kwargs['config']['api_key'], "prompted_api_key")
+                call_args, _ = mock_iscsi_component_class.call_args
+                self.assertEqual(call_args[0]['api_key'], "prompted_api_key")
+                
+                # The key is only stored once discovery connected with it
+                mock_keyring.set_password.assert_called_once_with(
+                    iscsi_script.KEYRING_SERVICE, "truenas.example.com", "prompted_api_key"
+                )
 
     @patch('scripts.test_iscsi_truenas_py312.getpass.getpass')
     @patch('scripts.test_iscsi_truenas_py312.ISCSIComponent')